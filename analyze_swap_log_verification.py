@@ -10,6 +10,7 @@ USAGE:
 
 REQUIREMENTS:
     - Python 3.6+
+    - Optional: orjson (faster parsing of large verification/liquidity files)
     - Swap log verification JSON files in: auction-data/mainnet/
     - Files should match pattern: *_swap_log_verification.json
 
@@ -21,6 +22,8 @@ OUTPUT:
         * Error categorization and examples
         * Difference distribution percentiles
         * Detailed debugging information
+    - Caches a per-file summary under ~/.cache/swap_log_verification/;
+      re-runs skip re-parsing files whose JSON sources have not changed since
 
 EXAMPLE:
     $ python3 analyze_swap_log_verification.py
@@ -30,12 +33,101 @@ EXAMPLE:
     ✅ Analysis complete!
 """
 
+import hashlib
 import json
+import mmap
 import os
+import pickle
+import re
+from bisect import bisect_left
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+try:
+    import orjson  # optional: faster parsing, and parsing mapped files in place
+except ImportError:
+    orjson = None
+
+# Number of files read ahead of the one currently being parsed
+READ_AHEAD = 8
+
+# Inclusive upper bounds (bps) of the perfect / within 1 / within 10 /
+# within 100 difference buckets; anything larger is over 100 bps
+DIFF_BUCKET_BOUNDS = (0, 1, 10, 100)
+
+# Error message markers, in priority order, and the category each maps to
+ERROR_CATEGORIES = (
+    ('VM execution error', "VM execution error"),
+    ('negative output delta', "Negative output delta"),
+    ('Swap failed in solver', "Solver calculation failed"),
+)
+# All markers in one pattern so each error message is scanned once
+ERROR_MARKER_PATTERN = re.compile('|'.join(re.escape(marker) for marker, _ in ERROR_CATEGORIES))
+
+# Per-file summaries are cached here, in one subdirectory per data directory
+# (named by a hash of its path); kept out of the possibly shared data directory
+CACHE_DIR = Path.home() / ".cache" / "swap_log_verification"
+# Bumped whenever the cached summary format (_summarize_file) changes
+CACHE_VERSION = 2
+
+# Fields of a failed swap kept in the summary (used for categorization and examples)
+FAILED_SWAP_FIELDS = ('kind', 'pool_version', 'error', 'amount_in', 'pool_address',
+                      'token_in', 'token_out', 'expected_amount_out', 'quoted_amount_out')
+
+
+def _cache_dir(auction_dir: Path) -> Path:
+    """Directory holding the cached summaries of one data directory."""
+    key = hashlib.sha1(os.fsencode(os.path.abspath(auction_dir))).hexdigest()
+    return CACHE_DIR / key
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _map_file(path: Path) -> Any:
+    """Return a file's contents for _parse_json.
+    
+    With orjson available this is a read-only mmap that orjson parses in
+    place, avoiding a copy of the whole file into a bytes object; otherwise
+    (or for empty files, which cannot be mapped) it is the file's bytes.
+    """
+    if orjson is None:
+        return path.read_bytes()
+    
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return f.read()
+    
+    if hasattr(mmap, 'MADV_WILLNEED'):
+        # Ask the kernel to read ahead and start paging the file in now,
+        # while we are still on a reader thread
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+        mm.madvise(mmap.MADV_WILLNEED)
+    return mm
+
+
+def _parse_json(raw: Any) -> Any:
+    """Parse contents returned by _map_file, closing any mapping."""
+    if isinstance(raw, mmap.mmap):
+        try:
+            with memoryview(raw) as view:
+                return orjson.loads(view)
+        finally:
+            raw.close()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class SwapLogAnalyzer:
@@ -43,28 +135,43 @@ class SwapLogAnalyzer:
     
     def __init__(self, auction_dir: Path):
         self.auction_dir = auction_dir
-        self.verification_files = sorted(auction_dir.glob("*_swap_log_verification.json"))
-        
-        # Statistics storage - keyed by "pool_type version" (e.g., "weightedProduct V2")
-        self.pool_stats = defaultdict(lambda: {
-            'total': 0,
-            'verified': 0,
-            'perfect': 0,
-            'errors': 0,
-            'within_1bps': 0,
-            'within_10bps': 0,
-            'within_100bps': 0,
-            'over_100bps': 0,
-            'pool_type': '',  # Store the base pool type
-            'version': '',    # Store the version
-        })
+        self.cache_dir = _cache_dir(auction_dir)
+        # Single directory pass with a suffix check; avoids glob's per-entry fnmatch
+        with os.scandir(auction_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith('_swap_log_verification.json')),
+                key=lambda e: e.name
+            )
+        self.verification_files = [Path(e.path) for e in entries]
+        
+        # Per-pool counters stored column-wise: each counter is a list indexed
+        # by the pool key's slot in _key_idx (pool keys are "pool_type version",
+        # e.g. "weightedProduct V2"). See the pool_stats property for the
+        # per-key dict view used by the report.
+        self._key_idx: Dict[str, int] = {}
+        self._key_meta: List[Tuple[str, str]] = []  # (pool_type, version) per slot
+        self.c_total: List[int] = []
+        self.c_verified: List[int] = []
+        self.c_perfect: List[int] = []
+        self.c_errors: List[int] = []
+        self.c_within_1bps: List[int] = []
+        self.c_within_10bps: List[int] = []
+        self.c_within_100bps: List[int] = []
+        self.c_over_100bps: List[int] = []
+        # Difference bucket columns, in DIFF_BUCKET_BOUNDS order
+        self._bucket_columns = (self.c_perfect, self.c_within_1bps, self.c_within_10bps,
+                                self.c_within_100bps, self.c_over_100bps)
         
         self.available_liquidity = defaultdict(int)
         self.liquidity_files_processed = 0
         
         self.error_types = defaultdict(lambda: defaultdict(int))
         self.error_examples = defaultdict(list)
-        self.difference_distributions = defaultdict(list)
+        self._example_counts: Dict[str, int] = {}  # examples stored per error_examples key
+        # Absolute difference (bps) -> number of verified swaps, per pool key.
+        # Differences take few distinct values, so this stays small however
+        # many swaps are analyzed while keeping percentiles exact.
+        self.difference_distributions = defaultdict(Counter)
         
         # Overall stats
         self.total_swaps = 0
@@ -88,166 +195,315 @@ class SwapLogAnalyzer:
             'errors': 0,
         }
         
+    @property
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-pool-key statistics rebuilt from the column counters."""
+        return {
+            pool_key: {
+                'total': self.c_total[idx],
+                'verified': self.c_verified[idx],
+                'perfect': self.c_perfect[idx],
+                'errors': self.c_errors[idx],
+                'within_1bps': self.c_within_1bps[idx],
+                'within_10bps': self.c_within_10bps[idx],
+                'within_100bps': self.c_within_100bps[idx],
+                'over_100bps': self.c_over_100bps[idx],
+                'pool_type': self._key_meta[idx][0],
+                'version': self._key_meta[idx][1],
+            }
+            for pool_key, idx in self._key_idx.items()
+        }
+    
+    def _add_pool_key(self, pool_key: str, pool_type: str, pool_version: str) -> int:
+        """Assign a counter slot to a newly seen pool key."""
+        idx = len(self._key_meta)
+        self._key_idx[pool_key] = idx
+        self._key_meta.append((pool_type, pool_version))
+        for column in (self.c_total, self.c_verified, self.c_perfect, self.c_errors,
+                       self.c_within_1bps, self.c_within_10bps, self.c_within_100bps,
+                       self.c_over_100bps):
+            column.append(0)
+        return idx
+    
     def analyze(self):
         """Run the complete analysis on all verification files."""
         print(f"Analyzing {len(self.verification_files)} verification files...")
         
-        for vf in self.verification_files:
-            self._analyze_file(vf)
+        # File reads release the GIL, so a few reader threads keep the next
+        # files in flight while the current one is being parsed
+        files = iter(self.verification_files)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=READ_AHEAD) as pool:
+            for vf in files:
+                pending.append((vf, pool.submit(self._read_files, vf)))
+                if len(pending) >= READ_AHEAD:
+                    break
+            
+            while pending:
+                vf, future = pending.popleft()
+                next_vf = next(files, None)
+                if next_vf is not None:
+                    pending.append((next_vf, pool.submit(self._read_files, next_vf)))
+                self._analyze_file(vf, *future.result())
+        
+        # Drop cached summaries of verification files no longer in the directory
+        listed = {f"{vf.name}.pickle" for vf in self.verification_files}
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name not in listed:
+                        os.unlink(entry.path)
+        except OSError:
+            pass  # No cache yet, or not writable; nothing to prune
         
         print(f"Analysis complete. Processed {self.total_swaps} total swaps.")
     
-    def _analyze_file(self, verification_file: Path):
-        """Analyze a single verification file."""
-        # First, try to analyze corresponding liquidity file
+    def _read_files(self, verification_file: Path) -> Tuple[Any, Any, Path, Any, Any]:
+        """Read a verification file and its liquidity sibling, or their cached summary.
+        
+        Runs on a reader thread, so errors are returned instead of raised and
+        reported by _analyze_file. Returns (summary, signature, liquidity_file,
+        liquidity_raw, raw); when the cached summary was taken from files with
+        the same (mtime_ns, size) signature, only the summary is read.
+        """
+        liquidity_file = verification_file.parent / verification_file.name.replace('_swap_log_verification.json', '_liquidity.json')
+        # Taken before reading, so a file that changes mid-read is re-read next run
+        signature = (_file_signature(verification_file), _file_signature(liquidity_file))
+        
+        try:
+            version, cached_signature, summary = pickle.loads(
+                (self.cache_dir / f"{verification_file.name}.pickle").read_bytes())
+            if version == CACHE_VERSION and cached_signature == signature:
+                return summary, signature, liquidity_file, None, None
+        except Exception:
+            pass  # No usable cache; fall back to the JSON files
+        
         try:
-            liquidity_file = verification_file.parent / verification_file.name.replace('_swap_log_verification.json', '_liquidity.json')
-            if liquidity_file.exists():
-                self._analyze_liquidity(liquidity_file)
+            liquidity_raw = _map_file(liquidity_file) if signature[1] is not None else None
         except Exception as e:
-            print(f"Error checking liquidity file for {verification_file.name}: {e}")
-
+            liquidity_raw = e
+        
         try:
-            with open(verification_file, 'r') as f:
-                data = json.load(f)
+            raw = _map_file(verification_file)
         except Exception as e:
-            print(f"Error reading {verification_file}: {e}")
-            return
+            raw = e
         
-        swaps = data.get('swaps', [])
-        self.total_swaps += len(swaps)
+        return None, signature, liquidity_file, liquidity_raw, raw
+    
+    def _analyze_file(self, verification_file: Path, summary: Any, signature: Any,
+                      liquidity_file: Path, liquidity_raw: Any, raw: Any):
+        """Analyze a single verification file from its cached summary or pre-read contents."""
+        if summary is None:
+            summary, cacheable = self._summarize_file(verification_file, liquidity_file, liquidity_raw, raw)
+            if cacheable:
+                try:
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    (self.cache_dir / f"{verification_file.name}.pickle").write_bytes(
+                        pickle.dumps((CACHE_VERSION, signature, summary), protocol=pickle.HIGHEST_PROTOCOL))
+                except OSError:
+                    pass  # e.g. read-only home directory; re-parse next run
+        
+        # Fold the summary into the running statistics
+        if summary['liquidity_kinds'] is not None:
+            self.liquidity_files_processed += 1
+            for kind, count in summary['liquidity_kinds'].items():
+                self.available_liquidity[kind] += count
         
-        for swap in swaps:
+        self.total_swaps += summary['total_swaps']
+        for swap in summary['failed_swaps']:
             self._analyze_swap(swap, verification_file.name)
+        for (pool_type, pool_version, diff_bps), count in summary['verified_groups']:
+            self._record_verified(pool_type, pool_version, diff_bps, count)
     
-    def _analyze_liquidity(self, liquidity_file: Path):
-        """Analyze a liquidity file to count available pools."""
+    def _summarize_file(self, verification_file: Path, liquidity_file: Path, liquidity_raw: Any, raw: Any) -> Tuple[Dict[str, Any], bool]:
+        """Parse raw file contents into the compact per-file summary.
+        
+        Returns (summary, cacheable); a summary is only cached when both files
+        were read without errors.
+        """
+        summary = {
+            'liquidity_kinds': None,
+            'total_swaps': 0,
+            'verified_groups': [],
+            'failed_swaps': [],
+        }
+        cacheable = True
+        
+        # First, analyze the corresponding liquidity file
+        if liquidity_raw is not None:
+            try:
+                if isinstance(liquidity_raw, Exception):
+                    raise liquidity_raw
+                data = _parse_json(liquidity_raw)
+                summary['liquidity_kinds'] = Counter(
+                    pool.get('kind', 'Unknown') for pool in data.get('liquidity', [])
+                )
+            except Exception as e:
+                print(f"Error reading liquidity {liquidity_file}: {e}")
+                cacheable = False
+
         try:
-            with open(liquidity_file, 'r') as f:
-                data = json.load(f)
-                
-            self.liquidity_files_processed += 1
-            liquidity = data.get('liquidity', [])
-            for pool in liquidity:
-                kind = pool.get('kind', 'Unknown')
-                self.available_liquidity[kind] += 1
+            if isinstance(raw, Exception):
+                raise raw
+            data = _parse_json(raw)
         except Exception as e:
-            print(f"Error reading liquidity {liquidity_file}: {e}")
+            print(f"Error reading {verification_file}: {e}")
+            return summary, False
+        
+        swaps = data.get('swaps', [])
+        summary['total_swaps'] = len(swaps)
+        
+        # Verified swaps only feed counters, so group them per file by
+        # (pool type, version, difference) and fold each group in once; most
+        # swaps fall into a handful of groups (e.g. exact 0 bps matches).
+        # Failed swaps are kept individually for categorization and examples.
+        verified_groups = Counter()
+        failed_swaps = summary['failed_swaps']
+        for swap in swaps:
+            if swap.get('verified', False):
+                verified_groups[(swap.get('kind', 'unknown'),
+                                 swap.get('pool_version', 'Unknown'),
+                                 swap.get('difference_bps'))] += 1
+            else:
+                failed_swaps.append({k: swap[k] for k in FAILED_SWAP_FIELDS if k in swap})
+        
+        summary['verified_groups'] = list(verified_groups.items())
+        return summary, cacheable
 
+    def _pool_slot(self, pool_type: str, pool_version: str) -> Tuple[str, int]:
+        """Return the combined pool key and its counter slot."""
+        pool_key = f"{pool_type} {pool_version}"
+        idx = self._key_idx.get(pool_key)
+        if idx is None:
+            idx = self._add_pool_key(pool_key, pool_type, pool_version)
+        return pool_key, idx
+    
+    def _record_verified(self, pool_type: str, pool_version: str, diff_bps: Any, count: int):
+        """Record `count` verified swaps sharing a pool type, version and difference."""
+        pool_key, idx = self._pool_slot(pool_type, pool_version)
+        self.c_total[idx] += count
+        self.c_verified[idx] += count
+        self.total_verified += count
+        
+        # Update version-level stats
+        if pool_version == 'V2':
+            version_stats = self.v2_stats
+        elif pool_version == 'V3':
+            version_stats = self.v3_stats
+        else:
+            version_stats = None
+        if version_stats is not None:
+            version_stats['total'] += count
+            version_stats['verified'] += count
+        
+        # Track difference distribution
+        if diff_bps is not None:
+            abs_diff = abs(diff_bps)
+            self.difference_distributions[pool_key][abs_diff] += count
+            
+            bucket = bisect_left(DIFF_BUCKET_BOUNDS, abs_diff)
+            self._bucket_columns[bucket][idx] += count
+            if bucket == 0 and version_stats is not None:
+                version_stats['perfect'] += count
+    
     def _analyze_swap(self, swap: Dict[str, Any], filename: str):
         """Analyze a single swap record."""
         pool_type = swap.get('kind', 'unknown')
         pool_version = swap.get('pool_version', 'Unknown')
         verified = swap.get('verified', False)
-        diff_bps = swap.get('difference_bps')
         error = swap.get('error', '')
         amount_in = swap.get('amount_in', '0')
         
-        # Create a combined key for pool type + version
-        pool_key = f"{pool_type} {pool_version}"
+        if verified:
+            self._record_verified(pool_type, pool_version, swap.get('difference_bps'), 1)
+            return
         
         # Update pool type stats
-        stats = self.pool_stats[pool_key]
-        stats['total'] += 1
-        stats['pool_type'] = pool_type
-        stats['version'] = pool_version
+        pool_key, idx = self._pool_slot(pool_type, pool_version)
+        self.c_total[idx] += 1
         
         # Update version-level stats
         if pool_version == 'V2':
             self.v2_stats['total'] += 1
-            if verified:
-                self.v2_stats['verified'] += 1
-            else:
-                self.v2_stats['errors'] += 1
+            self.v2_stats['errors'] += 1
         elif pool_version == 'V3':
             self.v3_stats['total'] += 1
-            if verified:
-                self.v3_stats['verified'] += 1
-            else:
-                self.v3_stats['errors'] += 1
+            self.v3_stats['errors'] += 1
         
-        if verified:
-            self.total_verified += 1
-            stats['verified'] += 1
-            
-            # Track difference distribution
-            if diff_bps is not None:
-                abs_diff = abs(diff_bps)
-                self.difference_distributions[pool_key].append(abs_diff)
-                
-                if abs_diff == 0:
-                    stats['perfect'] += 1
-                    if pool_version == 'V2':
-                        self.v2_stats['perfect'] += 1
-                    elif pool_version == 'V3':
-                        self.v3_stats['perfect'] += 1
-                elif abs_diff <= 1:
-                    stats['within_1bps'] += 1
-                elif abs_diff <= 10:
-                    stats['within_10bps'] += 1
-                elif abs_diff <= 100:
-                    stats['within_100bps'] += 1
-                else:
-                    stats['over_100bps'] += 1
+        self.total_errors += 1
+        self.c_errors[idx] += 1
+        
+        # Categorize errors
+        if amount_in == '0':
+            self.zero_amount_errors += 1
+            error_category = "Zero-amount swap"
         else:
-            self.total_errors += 1
-            stats['errors'] += 1
-            
-            # Categorize errors
-            if amount_in == '0':
-                self.zero_amount_errors += 1
-                error_category = "Zero-amount swap"
-            elif 'VM execution error' in error:
+            markers = set(ERROR_MARKER_PATTERN.findall(error))
+            error_category = next(
+                (category for marker, category in ERROR_CATEGORIES if marker in markers),
+                "Other error"
+            )
+            if error_category == "VM execution error":
                 self.vm_errors += 1
-                error_category = "VM execution error"
-            elif 'negative output delta' in error:
-                self.other_errors += 1
-                error_category = "Negative output delta"
-            elif 'Swap failed in solver' in error:
-                self.other_errors += 1
-                error_category = "Solver calculation failed"
             else:
                 self.other_errors += 1
-                error_category = "Other error"
-            
-            # Track error types by pool type+version
-            self.error_types[pool_key][error_category] += 1
-            
-            # Store example (limit to 3 per pool type+version per error category)
-            key = f"{pool_key}_{error_category}"
-            if len(self.error_examples.get(key, [])) < 3:
-                if key not in self.error_examples:
-                    self.error_examples[key] = []
-                self.error_examples[key].append({
-                    'filename': filename,
-                    'pool_address': swap.get('pool_address', 'N/A'),
-                    'pool_version': pool_version,
-                    'token_in': swap.get('token_in', 'N/A'),
-                    'token_out': swap.get('token_out', 'N/A'),
-                    'amount_in': amount_in,
-                    'expected_out': swap.get('expected_amount_out', 'N/A'),
-                    'quoted_out': swap.get('quoted_amount_out', 'N/A'),
-                    'error': error[:200] if error else 'N/A'
-                })
+        
+        # Track error types by pool type+version
+        self.error_types[pool_key][error_category] += 1
+        
+        # Store example (limit to 3 per pool type+version per error category)
+        key = f"{pool_key}_{error_category}"
+        count = self._example_counts.get(key, 0)
+        if count < 3:
+            self._example_counts[key] = count + 1
+            self.error_examples[key].append({
+                'filename': filename,
+                'pool_address': swap.get('pool_address', 'N/A'),
+                'pool_version': pool_version,
+                'token_in': swap.get('token_in', 'N/A'),
+                'token_out': swap.get('token_out', 'N/A'),
+                'amount_in': amount_in,
+                'expected_out': swap.get('expected_amount_out', 'N/A'),
+                'quoted_out': swap.get('quoted_amount_out', 'N/A'),
+                'error': error[:200] if error else 'N/A'
+            })
     
-    def _calculate_percentiles(self, values: List[float]) -> Dict[str, float]:
-        """Calculate percentile statistics for a list of values."""
-        if not values:
+    def _calculate_percentiles(self, histogram: Dict[float, int]) -> Dict[str, float]:
+        """Calculate percentile statistics from a value -> count histogram."""
+        if not histogram:
             return {'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
         
-        sorted_values = sorted(values)
-        n = len(sorted_values)
+        n = sum(histogram.values())
+        # Same nearest-rank positions as indexing the fully sorted values
+        targets = [('p50', int(n * 0.50)), ('p95', int(n * 0.95)), ('p99', int(n * 0.99))]
         
-        return {
-            'p50': sorted_values[int(n * 0.50)] if n > 0 else 0,
-            'p95': sorted_values[int(n * 0.95)] if n > 0 else 0,
-            'p99': sorted_values[int(n * 0.99)] if n > 0 else 0,
-            'max': sorted_values[-1] if n > 0 else 0,
-        }
+        result = {}
+        seen = 0
+        for value in sorted(histogram):
+            seen += histogram[value]
+            while targets and targets[0][1] < seen:
+                result[targets.pop(0)[0]] = value
+        result['max'] = value
+        
+        return result
     
     def generate_markdown_report(self, output_file: Path):
         """Generate a comprehensive markdown report."""
         report = []
+        pool_stats = self.pool_stats
+        
+        # Shared by the summary table, detailed section and error examples:
+        # pools sorted by version (V2 before V3), then by pool_type
+        sorted_pool_types = sorted(
+            pool_stats.items(),
+            key=lambda x: (x[1]['version'], x[1]['pool_type'])
+        )
+        # Difference percentiles for every pool key with recorded differences
+        percentiles_by_key = {
+            pool_key: self._calculate_percentiles(histogram)
+            for pool_key, histogram in self.difference_distributions.items()
+            if histogram
+        }
         
         # Header
         report.append("# Swap Log Verification Analysis Report")
@@ -262,7 +518,7 @@ class SwapLogAnalyzer:
         report.append(f"- **Successfully Verified:** {self.total_verified:,} ({self.total_verified/self.total_swaps*100:.1f}%)")
         report.append(f"- **Failed Verification:** {self.total_errors:,} ({self.total_errors/self.total_swaps*100:.1f}%)")
         
-        perfect_count = sum(stats['perfect'] for stats in self.pool_stats.values())
+        perfect_count = sum(stats['perfect'] for stats in pool_stats.values())
         report.append(f"- **Perfect Matches (0 bps):** {perfect_count:,} ({perfect_count/self.total_swaps*100:.1f}%)")
         
         # Version breakdown
@@ -294,7 +550,7 @@ class SwapLogAnalyzer:
         
         # Aggregate used stats by pool type (ignoring version for this table)
         used_by_type = defaultdict(int)
-        for stats in self.pool_stats.values():
+        for stats in pool_stats.values():
             used_by_type[stats['pool_type']] += stats['total']
             
         # Merge keys from both
@@ -327,13 +583,7 @@ class SwapLogAnalyzer:
         report.append("\n| Pool Type | Balancer Version | Total | Success Rate | Perfect Match | Median Diff | P99 Diff | Max Diff |")
         report.append("|-----------|------------------|------:|--------------:|--------------:|------------:|---------:|---------:|")
         
-        # Sort for the summary table: first by version (V2 before V3), then by pool_type
-        sorted_for_summary = sorted(
-            self.pool_stats.items(),
-            key=lambda x: (x[1]['version'], x[1]['pool_type'])
-        )
-        
-        for pool_key, stats in sorted_for_summary:
+        for pool_key, stats in sorted_pool_types:
             total = stats['total']
             verified = stats['verified']
             perfect = stats['perfect']
@@ -344,8 +594,8 @@ class SwapLogAnalyzer:
             perfect_rate = (perfect / total * 100) if total > 0 else 0
             
             # Get percentiles
-            if pool_key in self.difference_distributions and self.difference_distributions[pool_key]:
-                percentiles = self._calculate_percentiles(self.difference_distributions[pool_key])
+            percentiles = percentiles_by_key.get(pool_key)
+            if percentiles:
                 median = percentiles['p50']
                 p99 = percentiles['p99']
                 max_diff = percentiles['max']
@@ -365,7 +615,7 @@ class SwapLogAnalyzer:
         
         # Group by pool type
         pools_by_type = defaultdict(dict)
-        for pool_key, stats in self.pool_stats.items():
+        for pool_key, stats in pool_stats.items():
             pool_type = stats['pool_type']
             version = stats['version']
             pools_by_type[pool_type][version] = stats
@@ -398,9 +648,9 @@ class SwapLogAnalyzer:
                 # Get difference percentiles for comparison
                 v2_key = f"{pool_type} V2"
                 v3_key = f"{pool_type} V3"
-                if v2_key in self.difference_distributions and v3_key in self.difference_distributions:
-                    v2_p99 = self._calculate_percentiles(self.difference_distributions[v2_key])['p99']
-                    v3_p99 = self._calculate_percentiles(self.difference_distributions[v3_key])['p99']
+                if v2_key in percentiles_by_key and v3_key in percentiles_by_key:
+                    v2_p99 = percentiles_by_key[v2_key]['p99']
+                    v3_p99 = percentiles_by_key[v3_key]['p99']
                     report.append(f"| {pool_type} | **P99 Difference (bps)** | {v2_p99:.2f} | {v3_p99:.2f} | {v2_p99 - v3_p99:+.2f} |")
                 
                 report.append("| | | | | |")  # Separator row
@@ -412,12 +662,6 @@ class SwapLogAnalyzer:
         # Pool Type Analysis
         report.append("## Detailed Pool Type Analysis\n")
         
-        # Sort pool types: first by version (V2 before V3), then by pool_type alphabetically
-        sorted_pool_types = sorted(
-            self.pool_stats.items(),
-            key=lambda x: (x[1]['version'], x[1]['pool_type'])
-        )
-        
         # Add section headers for V2 and V3 and generate sections
         current_version = None
         for pool_key, stats in sorted_pool_types:
@@ -428,7 +672,7 @@ class SwapLogAnalyzer:
                 report.append(f"### Balancer {version} Pools\n")
                 current_version = version
             
-            report.extend(self._generate_pool_type_section(pool_key, stats))
+            report.extend(self._generate_pool_type_section(pool_key, stats, percentiles_by_key.get(pool_key)))
         
         # Detailed Error Examples
         report.append("\n---\n")
@@ -467,7 +711,8 @@ class SwapLogAnalyzer:
         
         print(f"\nReport written to: {output_file}")
     
-    def _generate_pool_type_section(self, pool_key: str, stats: Dict[str, int]) -> List[str]:
+    def _generate_pool_type_section(self, pool_key: str, stats: Dict[str, int],
+                                    percentiles: Optional[Dict[str, float]]) -> List[str]:
         """Generate markdown section for a pool type+version combination."""
         section = []
         
@@ -518,8 +763,7 @@ class SwapLogAnalyzer:
             section.append(f"| Over 100 bps | {over_100bps:,} | {over_100bps/total*100:.1f}% |")
         
         # Percentile statistics for differences
-        if pool_key in self.difference_distributions and self.difference_distributions[pool_key]:
-            percentiles = self._calculate_percentiles(self.difference_distributions[pool_key])
+        if percentiles:
             section.append("\n**Difference Distribution (for verified swaps):**")
             section.append(f"- Median (p50): {percentiles['p50']:.2f} bps")
             section.append(f"- 95th percentile: {percentiles['p95']:.2f} bps")
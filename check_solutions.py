@@ -5,9 +5,25 @@ Script to check if all solution files in auction-data are empty.
 
 import json
 import os
+import multiprocessing
 from pathlib import Path
 from collections import defaultdict
 
+def _probe_file(solution_file):
+    """Read one solution file and return (name, status, solution count or error)."""
+    try:
+        with open(solution_file, 'r') as f:
+            data = json.load(f)
+        
+        solutions = data.get("solutions", [])
+        
+        if len(solutions) == 0:
+            return solution_file.name, "empty", 0
+        return solution_file.name, "with_solutions", len(solutions)
+    
+    except Exception as e:
+        return solution_file.name, "error", str(e)
+
 def check_solutions():
     auction_dir = Path(os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum"))
     
@@ -16,7 +32,12 @@ def check_solutions():
         return
     
     # Find all solution files
-    solution_files = sorted(auction_dir.glob("*_solutions.json"))
+    with os.scandir(auction_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith("_solutions.json")),
+            key=lambda e: e.name
+        )
+    solution_files = [Path(e.path) for e in entries]
     
     if not solution_files:
         print("No solution files found!")
@@ -34,22 +55,16 @@ def check_solutions():
     files_with_solutions = []
     files_with_errors = []
     
-    for solution_file in solution_files:
-        try:
-            with open(solution_file, 'r') as f:
-                data = json.load(f)
-            
-            solutions = data.get("solutions", [])
-            
-            if len(solutions) == 0:
-                stats["empty"] += 1
-            else:
-                stats["with_solutions"] += 1
-                files_with_solutions.append((solution_file.name, len(solutions)))
-                
-        except Exception as e:
-            stats["error"] += 1
-            files_with_errors.append((solution_file.name, str(e)))
+    # Files are independent, so parse them across all cores
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        results = pool.map(_probe_file, solution_files)
+    
+    for name, status, count_or_err in results:
+        stats[status] += 1
+        if status == "with_solutions":
+            files_with_solutions.append((name, count_or_err))
+        elif status == "error":
+            files_with_errors.append((name, count_or_err))
     
     # Print summary
     print("=" * 70)
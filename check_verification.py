@@ -4,246 +4,545 @@ Script to analyze solution verification files and check for errors and accuracy.
 """
 
 import json
+import mmap
 import os
+import pickle
+import sys
+import multiprocessing
+from bisect import bisect_left
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-def check_verifications():
-    auction_dir = Path(os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum"))
+try:
+    import ijson  # optional: stream files instead of loading them whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster whole-file parsing when not streaming
+except ImportError:
+    orjson = None
+
+def _load(f):
+    """Parse a whole open (binary) JSON file.
     
-    if not auction_dir.exists():
-        print(f"Error: Directory {auction_dir} does not exist")
-        return
+    With orjson the file is memory-mapped and parsed in place, so its
+    contents are never copied into a bytes object; empty files cannot be
+    mapped and are read normally.
+    """
+    if orjson is None:
+        return json.load(f)
     
-    # Find all verification files
-    verification_files = sorted(auction_dir.glob("*_solution_verification.json"))
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return orjson.loads(f.read())
     
-    if not verification_files:
-        print("No verification files found!")
-        return
+    try:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+    finally:
+        mm.close()
+
+# Swap fields read by the tally loop; the sample fields are only needed for the printed error / large-difference examples
+SWAP_FIELDS = ("difference_bps", "quote_error", "pool_version", "pool_id")
+SAMPLE_FIELDS = ("interaction_index", "token_in", "token_out",
+                 "expected_amount_out", "quoted_amount_out")
+
+def _swap_rows(swaps):
+    """Project swap dicts to (difference_bps, quote_error, pool_version, pool_id, swap) rows."""
+    return [
+        (swap.get("difference_bps", 0), swap.get("quote_error"),
+         swap.get("pool_version", "Unknown"), swap.get("pool_id", "?"), swap)
+        for swap in swaps
+    ]
+
+def _parse_solution_rows(f):
+    """Yield (solution_index, rows) per solution from ijson parse events.
     
-    print(f"Analyzing {len(verification_files)} verification files...\n")
+    Only the fields in SWAP_FIELDS and SAMPLE_FIELDS are materialized; the
+    last element of each row is a dict holding just the sample fields.
+    """
+    wanted = set(SWAP_FIELDS).union(SAMPLE_FIELDS)
+    solution_index = "?"
+    rows = []
+    swap = None
+    builder = None  # set while collecting a wanted field that holds a container
+    depth = 0
     
-    stats = {
-        "total_files": len(verification_files),
-        "total_solutions": 0,
-        "total_swaps": 0,
-        "swaps_with_errors": 0,
-        "swaps_with_difference": 0,
-        "error_files": 0,
-    }
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+                if depth == 0:
+                    swap[builder_key] = builder.value
+                    builder = None
+            continue
+        
+        if prefix == 'item':
+            if event == 'start_map':
+                solution_index = "?"
+                rows = []
+            elif event == 'end_map':
+                yield solution_index, rows
+            elif event != 'map_key':
+                raise ValueError(f"solution is a JSON {event}, not an object")
+        elif prefix == 'item.solution_index':
+            if event not in ('start_map', 'start_array', 'map_key'):
+                solution_index = value
+        elif prefix == 'item.swaps.item':
+            if event == 'start_map':
+                swap = {}
+            elif event == 'end_map':
+                rows.append((swap.get("difference_bps", 0), swap.get("quote_error"),
+                             swap.get("pool_version", "Unknown"), swap.get("pool_id", "?"), swap))
+                swap = None
+            elif event != 'map_key':
+                raise ValueError(f"swap is a JSON {event}, not an object")
+        elif swap is not None and prefix.startswith('item.swaps.item.'):
+            key = prefix[len('item.swaps.item.'):]
+            if key in wanted:
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    builder_key = key
+                    depth = 1
+                elif event != 'map_key':
+                    swap[key] = value
+
+def _read_solutions(f):
+    """Return an iterable of (solution_index, swap rows) for an open (binary) verification file.
     
-    error_types = defaultdict(int)
-    pool_versions = defaultdict(int)  # V2 vs V3
-    pool_types = defaultdict(int)     # Weighted, Stable, Gyro, etc.
-    difference_ranges = {
-        "0 bps": 0,
-        "1-10 bps": 0,
-        "11-50 bps": 0,
-        "51-100 bps": 0,
-        ">100 bps": 0,
-    }
+    Returns None if the file does not hold a JSON list. With ijson installed
+    the file is walked as a parse-event stream and only the swap fields the
+    report uses are materialized, keeping memory flat regardless of file
+    size; otherwise the file is loaded whole and its swaps projected.
+    """
+    if ijson is not None:
+        # An empty or blank start is left to the parser, which reports it
+        # as a decode error like json.load does
+        head = f.peek(1).lstrip()
+        if head and not head.startswith(b'['):
+            return None
+        return _parse_solution_rows(f)
     
-    files_with_errors = []
-    swaps_with_large_differences = []
-    error_details = []
+    data = _load(f)
+    if not isinstance(data, list):
+        return None
+    return ((solution.get("solution_index", "?"), _swap_rows(solution.get("swaps", [])))
+            for solution in data)
+
+def _read_pools(f):
+    """Return an iterable over the pools in an open (binary) liquidity file."""
+    if ijson is not None:
+        return ijson.items(f, 'liquidity.item', use_float=True)
+    return _load(f).get('liquidity', [])
+
+# Only this many error / large-difference samples are printed, so workers
+# return at most this many (the totals come from the counters)
+MAX_ERROR_DETAILS = 20
+MAX_LARGE_DIFFERENCES = 10
+
+# Verification files are named <auction_id><VERIFICATION_SUFFIX>
+VERIFICATION_SUFFIX = "_solution_verification.json"
+_VSUF_LEN = len(VERIFICATION_SUFFIX)
+
+# Below this many changed files a worker pool costs more to start than it saves
+MIN_FILES_FOR_POOL = 8
+
+# Per-file results from earlier runs, keyed by absolute verification file path and
+# reused while neither the file nor its liquidity file has changed
+CACHE_FILE = Path.home() / ".cache" / "check_verifications.pickle"
+# Bumped whenever the cached partial-result format changes
+CACHE_VERSION = 1
+
+# Longest bar drawn in the breakdowns (100% at two percent per block)
+_BAR = "█" * 50
+
+# Named difference ranges; non-zero differences fall into the first range
+# whose inclusive upper bound (bps) they do not exceed
+DIFFERENCE_RANGES = ("0 bps", "1-10 bps", "11-50 bps", "51-100 bps", ">100 bps")
+DIFFERENCE_BOUNDS = (10, 50, 100)
+
+def _bucket_differences(diff_counts, difference_ranges):
+    """Fold a Counter of difference_bps values into the named ranges."""
+    for difference_bps, count in diff_counts.items():
+        if difference_bps == 0:
+            difference_ranges["0 bps"] += count
+        else:
+            index = bisect_left(DIFFERENCE_BOUNDS, difference_bps) + 1
+            difference_ranges[DIFFERENCE_RANGES[index]] += count
+
+def _load_pool_kinds(liquidity_file):
+    """Map pool_id -> pool kind from an auction's liquidity file.
     
-    # Build a mapping of pool_id to pool_kind from liquidity files
+    Returns an empty mapping if there is no (readable) liquidity file.
+    """
     pool_id_to_kind = {}
-    for verification_file in verification_files:
-        auction_id = verification_file.stem.replace("_solution_verification", "")
-        liquidity_file = auction_dir / f"{auction_id}_liquidity.json"
+    if liquidity_file is None:
+        return pool_id_to_kind
+    try:
+        with open(liquidity_file, 'rb') as f:
+            for pool in _read_pools(f):
+                pool_id_to_kind[pool.get('id')] = pool.get('kind', 'unknown')
+    except Exception:
+        pass  # Skip if we can't read the liquidity file
+    return pool_id_to_kind
+
+def _process_verification_file(files):
+    """Tally a single (verification_file, liquidity_file) pair.
+    
+    liquidity_file is None when the auction has none. Runs in a worker
+    process and returns partial statistics that check_verifications merges
+    in file order.
+    """
+    verification_file, liquidity_file = files
+    partial = {
+        "stats": {
+            "total_solutions": 0,
+            "total_swaps": 0,
+            "swaps_with_errors": 0,
+            "swaps_with_difference": 0,
+        },
+        "error_types": Counter(),
+        "pool_versions": Counter(),
+        "pool_types": Counter(),     # keyed by (pool_version, pool_kind)
+        "difference_ranges": defaultdict(int),
+        "error_details": [],
+        "large_differences": [],
+        "warning": None,
+        "read_error": None,
+    }
+    stats = partial["stats"]
+    difference_ranges = partial["difference_ranges"]
+    error_details = partial["error_details"]
+    swaps_with_large_differences = partial["large_differences"]
+    
+    # Keys are collected per swap and counted in one Counter.update per file
+    versions_buf = []
+    types_buf = []
+    errors_buf = []
+    diffs_buf = []
+    
+    try:
+        auction_id = verification_file.name[:-_VSUF_LEN]
         
-        if liquidity_file.exists():
-            try:
-                with open(liquidity_file, 'r') as f:
-                    liq_data = json.load(f)
-                    for pool in liq_data.get('liquidity', []):
-                        pool_id_to_kind[pool.get('id')] = pool.get('kind', 'unknown')
-            except Exception:
-                pass  # Skip if we can't read the liquidity file
-    
-    for verification_file in verification_files:
-        try:
-            with open(verification_file, 'r') as f:
-                data = json.load(f)
-            
-            auction_id = verification_file.stem.replace("_solution_verification", "")
+        with open(verification_file, 'rb') as f:
+            solutions = _read_solutions(f)
             
-            if not isinstance(data, list):
-                print(f"Warning: {verification_file.name} is not a list")
-                continue
+            if solutions is None:
+                partial["warning"] = f"Warning: {verification_file.name} is not a list"
+                return partial
             
-            stats["total_solutions"] += len(data)
+            # Pool ids are per auction, so only this auction's liquidity is needed
+            pool_id_to_kind = _load_pool_kinds(liquidity_file)
             
-            for solution in data:
-                solution_index = solution.get("solution_index", "?")
-                swaps = solution.get("swaps", [])
-                stats["total_swaps"] += len(swaps)
+            # Each swap arrives as a (difference_bps, quote_error, pool_version,
+            # pool_id, swap) row; swap is only read for the sample fields
+            for solution_index, rows in solutions:
+                stats["total_solutions"] += 1
+                stats["total_swaps"] += len(rows)
                 
-                for swap in swaps:
-                    difference_bps = swap.get("difference_bps", 0)
-                    quote_error = swap.get("quote_error")
-                    
+                for difference_bps, quote_error, pool_version, pool_id, swap in rows:
                     # Track pool version (V2 vs V3)
-                    pool_version = swap.get("pool_version", "Unknown")
-                    pool_versions[pool_version] += 1
+                    versions_buf.append(pool_version)
                     
                     # Get pool kind from the liquidity mapping
-                    pool_id = swap.get("pool_id", "?")
                     pool_kind = pool_id_to_kind.get(pool_id, "unknown")
                     
                     # Track pool types with version prefix
-                    pool_type_key = f"{pool_version} {pool_kind}"
-                    pool_types[pool_type_key] += 1
+                    types_buf.append((pool_version, pool_kind))
                     
                     # Track quote errors
                     if quote_error:
-                        stats["swaps_with_errors"] += 1
-                        error_types[quote_error] += 1
-                        error_details.append({
-                            "file": verification_file.name,
-                            "auction_id": auction_id,
-                            "solution_index": solution_index,
-                            "interaction_index": swap.get("interaction_index", "?"),
-                            "pool_id": swap.get("pool_id", "?"),
-                            "token_in": swap.get("token_in", "?"),
-                            "token_out": swap.get("token_out", "?"),
-                            "error": quote_error
-                        })
-                    
-                    # Track differences
-                    if difference_bps is not None:
-                        if difference_bps != 0:
-                            stats["swaps_with_difference"] += 1
-                        
-                        if difference_bps == 0:
-                            difference_ranges["0 bps"] += 1
-                        elif difference_bps <= 10:
-                            difference_ranges["1-10 bps"] += 1
-                        elif difference_bps <= 50:
-                            difference_ranges["11-50 bps"] += 1
-                        elif difference_bps <= 100:
-                            difference_ranges["51-100 bps"] += 1
-                        else:
-                            difference_ranges[">100 bps"] += 1
-                            swaps_with_large_differences.append({
+                        errors_buf.append(quote_error)
+                        if len(error_details) < MAX_ERROR_DETAILS:
+                            error_details.append({
                                 "file": verification_file.name,
                                 "auction_id": auction_id,
                                 "solution_index": solution_index,
                                 "interaction_index": swap.get("interaction_index", "?"),
-                                "pool_id": swap.get("pool_id", "?"),
-                                "difference_bps": difference_bps,
-                                "expected": swap.get("expected_amount_out"),
-                                "quoted": swap.get("quoted_amount_out"),
+                                "pool_id": pool_id,
+                                "token_in": swap.get("token_in", "?"),
+                                "token_out": swap.get("token_out", "?"),
+                                "error": quote_error
                             })
-                
-        except Exception as e:
+                    
+                    # Track differences
+                    if difference_bps is not None:
+                        if difference_bps > 100:
+                            if len(swaps_with_large_differences) < MAX_LARGE_DIFFERENCES:
+                                swaps_with_large_differences.append({
+                                    "file": verification_file.name,
+                                    "auction_id": auction_id,
+                                    "solution_index": solution_index,
+                                    "interaction_index": swap.get("interaction_index", "?"),
+                                    "pool_id": pool_id,
+                                    "difference_bps": difference_bps,
+                                    "expected": swap.get("expected_amount_out"),
+                                    "quoted": swap.get("quoted_amount_out"),
+                                })
+                        diffs_buf.append(difference_bps)
+    
+    except Exception as e:
+        partial["read_error"] = str(e)
+    
+    partial["pool_versions"].update(versions_buf)
+    partial["pool_types"].update(types_buf)
+    partial["error_types"].update(errors_buf)
+    stats["swaps_with_errors"] = len(errors_buf)
+    
+    # Most swaps share a handful of difference values, so bucket the distinct
+    # values rather than every swap
+    diff_counts = Counter(diffs_buf)
+    _bucket_differences(diff_counts, difference_ranges)
+    stats["swaps_with_difference"] = len(diffs_buf) - diff_counts[0]
+    
+    return partial
+
+def _entry_signature(entry):
+    """(mtime_ns, size) of a directory entry, or None if there is no entry."""
+    if entry is None:
+        return None
+    st = entry.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+def _load_cache():
+    """Load the per-file results cache, or an empty one."""
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            version, cache = pickle.load(f)
+    except Exception:
+        return {}
+    return cache if version == CACHE_VERSION and isinstance(cache, dict) else {}
+
+def _save_cache(cache):
+    """Write the per-file results cache; failures only cost the next run time."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((CACHE_VERSION, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: could not write cache {CACHE_FILE}: {e}")
+
+def check_verifications(auction_dir=None):
+    """Summarize every verification file in auction_dir (default: $AUCTION_DIR)."""
+    if auction_dir is None:
+        auction_dir = os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum")
+    auction_dir = Path(auction_dir)
+    
+    if not auction_dir.exists():
+        print(f"Error: Directory {auction_dir} does not exist")
+        return
+    
+    # Scan the directory once; liquidity files are then looked up by name
+    with os.scandir(auction_dir) as it:
+        entries = {e.name: e for e in it if e.is_file()}
+    
+    # Find all verification files
+    verification_names = sorted(name for name in entries if name.endswith(VERIFICATION_SUFFIX))
+    verification_files = [auction_dir / name for name in verification_names]
+    
+    if not verification_files:
+        print("No verification files found!")
+        return
+    
+    print(f"Analyzing {len(verification_files)} verification files...\n")
+    
+    stats = {
+        "total_files": len(verification_files),
+        "total_solutions": 0,
+        "total_swaps": 0,
+        "swaps_with_errors": 0,
+        "swaps_with_difference": 0,
+        "error_files": 0,
+    }
+    
+    error_types = Counter()
+    pool_versions = Counter()  # V2 vs V3
+    pool_types = Counter()     # (version, kind): Weighted, Stable, Gyro, etc.
+    difference_ranges = dict.fromkeys(DIFFERENCE_RANGES, 0)
+    
+    files_with_errors = []
+    swaps_with_large_differences = []
+    error_details = []
+    
+    # Reuse results for files unchanged since the last run; keys are absolute
+    # so runs from different working directories do not mix up relative paths
+    cache = _load_cache()
+    directory = os.path.abspath(auction_dir)
+    keys = [os.path.join(directory, name) for name in verification_names]
+    signatures = {}
+    cached_partials = {}
+    stale_files = []
+    for name, verification_file, key in zip(verification_names, verification_files, keys):
+        liquidity_entry = entries.get(f"{name[:-_VSUF_LEN]}_liquidity.json")
+        signatures[key] = (_entry_signature(entries[name]), _entry_signature(liquidity_entry))
+        entry = cache.get(key)
+        if entry is not None and entry[0] == signatures[key]:
+            cached_partials[key] = entry[1]
+        else:
+            liquidity_file = auction_dir / liquidity_entry.name if liquidity_entry else None
+            stale_files.append((verification_file, liquidity_file))
+    
+    # Files are independent: tally the changed ones, in worker processes when
+    # there are enough of them, then merge all partial results in file order
+    if len(stale_files) < MIN_FILES_FOR_POOL:
+        fresh_partials = map(_process_verification_file, stale_files)
+    else:
+        with multiprocessing.Pool() as pool:
+            fresh_partials = iter(pool.map(_process_verification_file, stale_files, chunksize=16))
+    
+    for verification_file, key in zip(verification_files, keys):
+        if key in cached_partials:
+            partial = cached_partials[key]
+        else:
+            partial = next(fresh_partials)
+            if partial["read_error"] is None:
+                cache[key] = (signatures[key], partial)
+        
+        if partial["warning"]:
+            print(partial["warning"])
+            continue
+        
+        for stat, count in partial["stats"].items():
+            stats[stat] += count
+        error_types.update(partial["error_types"])
+        pool_versions.update(partial["pool_versions"])
+        pool_types.update(partial["pool_types"])
+        for range_name, count in partial["difference_ranges"].items():
+            difference_ranges[range_name] += count
+        error_details.extend(partial["error_details"][:MAX_ERROR_DETAILS - len(error_details)])
+        swaps_with_large_differences.extend(
+            partial["large_differences"][:MAX_LARGE_DIFFERENCES - len(swaps_with_large_differences)])
+        
+        if partial["read_error"] is not None:
             stats["error_files"] += 1
-            files_with_errors.append((verification_file.name, str(e)))
-    
-    # Print summary
-    print("=" * 80)
-    print("VERIFICATION SUMMARY")
-    print("=" * 80)
-    print(f"Total verification files:    {stats['total_files']}")
-    print(f"Total solutions verified:    {stats['total_solutions']}")
-    print(f"Total swaps verified:        {stats['total_swaps']}")
-    print(f"Swaps with quote errors:     {stats['swaps_with_errors']} ({stats['swaps_with_errors']/max(stats['total_swaps'], 1)*100:.2f}%)")
-    print(f"Swaps with differences:      {stats['swaps_with_difference']} ({stats['swaps_with_difference']/max(stats['total_swaps'], 1)*100:.2f}%)")
-    print(f"Files with read errors:      {stats['error_files']}")
-    print("=" * 80)
+            files_with_errors.append((verification_file.name, partial["read_error"]))
+    
+    # Forget files of this directory that have since been removed
+    removed = [key for key in cache
+               if key not in signatures and os.path.dirname(key) == directory]
+    for key in removed:
+        del cache[key]
+    
+    if stale_files or removed:
+        _save_cache(cache)
+    
+    # Build the summary and write it out in one go
+    out = []
+    denom = max(stats['total_swaps'], 1)
+    out.append("=" * 80)
+    out.append("VERIFICATION SUMMARY")
+    out.append("=" * 80)
+    out.append(f"Total verification files:    {stats['total_files']}")
+    out.append(f"Total solutions verified:    {stats['total_solutions']}")
+    out.append(f"Total swaps verified:        {stats['total_swaps']}")
+    out.append(f"Swaps with quote errors:     {stats['swaps_with_errors']} ({stats['swaps_with_errors']/denom*100:.2f}%)")
+    out.append(f"Swaps with differences:      {stats['swaps_with_difference']} ({stats['swaps_with_difference']/denom*100:.2f}%)")
+    out.append(f"Files with read errors:      {stats['error_files']}")
+    out.append("=" * 80)
     
     # Print pool version breakdown
     if pool_versions:
-        print("\nPOOL VERSION BREAKDOWN:")
-        print("-" * 80)
+        out.append("\nPOOL VERSION BREAKDOWN:")
+        out.append("-" * 80)
         for version, count in sorted(pool_versions.items()):
-            percentage = count / max(stats['total_swaps'], 1) * 100
-            bar = "█" * int(percentage / 2)
-            print(f"{version:>10}: {count:6} ({percentage:6.2f}%) {bar}")
-        print("-" * 80)
+            percentage = count / denom * 100
+            bar = _BAR[:int(percentage / 2)]
+            out.append(f"{version:>10}: {count:6} ({percentage:6.2f}%) {bar}")
+        out.append("-" * 80)
     
     # Print pool type breakdown
     if pool_types:
-        print("\nPOOL TYPE BREAKDOWN:")
-        print("-" * 80)
-        for pool_type, count in sorted(pool_types.items(), key=lambda x: x[1], reverse=True):
-            percentage = count / max(stats['total_swaps'], 1) * 100
-            bar = "█" * int(percentage / 2)
-            print(f"{pool_type:>20}: {count:6} ({percentage:6.2f}%) {bar}")
-        print("-" * 80)
+        out.append("\nPOOL TYPE BREAKDOWN:")
+        out.append("-" * 80)
+        for (version, kind), count in sorted(pool_types.items(), key=lambda x: x[1], reverse=True):
+            pool_type = f"{version} {kind}"
+            percentage = count / denom * 100
+            bar = _BAR[:int(percentage / 2)]
+            out.append(f"{pool_type:>20}: {count:6} ({percentage:6.2f}%) {bar}")
+        out.append("-" * 80)
     
     # Print difference distribution
-    print("\nDIFFERENCE DISTRIBUTION (Expected vs Quoted):")
-    print("-" * 80)
+    out.append("\nDIFFERENCE DISTRIBUTION (Expected vs Quoted):")
+    out.append("-" * 80)
     for range_name, count in difference_ranges.items():
-        percentage = count / max(stats['total_swaps'], 1) * 100
-        bar = "█" * int(percentage / 2)
-        print(f"{range_name:>12}: {count:6} ({percentage:6.2f}%) {bar}")
-    print("-" * 80)
+        percentage = count / denom * 100
+        bar = _BAR[:int(percentage / 2)]
+        out.append(f"{range_name:>12}: {count:6} ({percentage:6.2f}%) {bar}")
+    out.append("-" * 80)
     
     # Print error types
     if error_types:
-        print("\nERROR TYPES:")
-        print("-" * 80)
+        out.append("\nERROR TYPES:")
+        out.append("-" * 80)
         for error_type, count in sorted(error_types.items(), key=lambda x: x[1], reverse=True):
-            print(f"{error_type}: {count}")
-        print("-" * 80)
+            out.append(f"{error_type}: {count}")
+        out.append("-" * 80)
     
     # Print detailed errors
     if error_details:
-        print(f"\n⚠ SWAPS WITH QUOTE ERRORS ({len(error_details)}):")
-        print("-" * 80)
-        for detail in error_details[:20]:  # Show first 20
-            print(f"File: {detail['file']}")
-            print(f"  Solution {detail['solution_index']}, Interaction {detail['interaction_index']}")
-            print(f"  Pool: {detail['pool_id']}")
-            print(f"  {detail['token_in'][:10]}... -> {detail['token_out'][:10]}...")
-            print(f"  Error: {detail['error']}")
-            print()
-        if len(error_details) > 20:
-            print(f"  ... and {len(error_details) - 20} more errors")
+        out.append(f"\n⚠ SWAPS WITH QUOTE ERRORS ({stats['swaps_with_errors']}):")
+        out.append("-" * 80)
+        for detail in error_details:  # First MAX_ERROR_DETAILS
+            out.append(f"File: {detail['file']}")
+            out.append(f"  Solution {detail['solution_index']}, Interaction {detail['interaction_index']}")
+            out.append(f"  Pool: {detail['pool_id']}")
+            out.append(f"  {detail['token_in'][:10]}... -> {detail['token_out'][:10]}...")
+            out.append(f"  Error: {detail['error']}")
+            out.append("")
+        if stats['swaps_with_errors'] > len(error_details):
+            out.append(f"  ... and {stats['swaps_with_errors'] - len(error_details)} more errors")
     else:
-        print("\n✓ NO QUOTE ERRORS FOUND!")
+        out.append("\n✓ NO QUOTE ERRORS FOUND!")
     
     # Print large differences
     if swaps_with_large_differences:
-        print(f"\n⚠ SWAPS WITH LARGE DIFFERENCES (>100 bps) ({len(swaps_with_large_differences)}):")
-        print("-" * 80)
-        for detail in swaps_with_large_differences[:10]:  # Show first 10
-            print(f"File: {detail['file']}, Solution {detail['solution_index']}")
-            print(f"  Pool: {detail['pool_id']}, Difference: {detail['difference_bps']} bps")
-            print(f"  Expected: {detail['expected']}, Quoted: {detail['quoted']}")
-            print()
-        if len(swaps_with_large_differences) > 10:
-            print(f"  ... and {len(swaps_with_large_differences) - 10} more large differences")
+        out.append(f"\n⚠ SWAPS WITH LARGE DIFFERENCES (>100 bps) ({difference_ranges['>100 bps']}):")
+        out.append("-" * 80)
+        for detail in swaps_with_large_differences:  # First MAX_LARGE_DIFFERENCES
+            out.append(f"File: {detail['file']}, Solution {detail['solution_index']}")
+            out.append(f"  Pool: {detail['pool_id']}, Difference: {detail['difference_bps']} bps")
+            out.append(f"  Expected: {detail['expected']}, Quoted: {detail['quoted']}")
+            out.append("")
+        if difference_ranges['>100 bps'] > len(swaps_with_large_differences):
+            out.append(f"  ... and {difference_ranges['>100 bps'] - len(swaps_with_large_differences)} more large differences")
     else:
-        print("\n✓ NO SWAPS WITH LARGE DIFFERENCES (>100 bps)!")
+        out.append("\n✓ NO SWAPS WITH LARGE DIFFERENCES (>100 bps)!")
     
     # Print file errors
     if files_with_errors:
-        print(f"\n⚠ FILES WITH READ ERRORS ({len(files_with_errors)}):")
-        print("-" * 80)
+        out.append(f"\n⚠ FILES WITH READ ERRORS ({len(files_with_errors)}):")
+        out.append("-" * 80)
         for filename, error in files_with_errors:
-            print(f"  - {filename}: {error}")
+            out.append(f"  - {filename}: {error}")
     
     # Final assessment
-    print("\n" + "=" * 80)
-    print("OVERALL ASSESSMENT:")
-    print("=" * 80)
+    out.append("\n" + "=" * 80)
+    out.append("OVERALL ASSESSMENT:")
+    out.append("=" * 80)
     
     if stats['swaps_with_errors'] == 0 and stats['error_files'] == 0:
-        print("✓ ALL VERIFICATIONS PASSED - No quote errors detected!")
+        out.append("✓ ALL VERIFICATIONS PASSED - No quote errors detected!")
     else:
-        print("✗ ISSUES FOUND - See details above")
+        out.append("✗ ISSUES FOUND - See details above")
+    
+    accuracy_rate = (stats['total_swaps'] - stats['swaps_with_errors']) / denom * 100
+    out.append(f"Accuracy Rate: {accuracy_rate:.2f}%")
     
-    accuracy_rate = (stats['total_swaps'] - stats['swaps_with_errors']) / max(stats['total_swaps'], 1) * 100
-    print(f"Accuracy Rate: {accuracy_rate:.2f}%")
+    perfect_match_rate = difference_ranges["0 bps"] / denom * 100
+    out.append(f"Perfect Match Rate (0 bps): {perfect_match_rate:.2f}%")
+    out.append("=" * 80)
     
-    perfect_match_rate = difference_ranges["0 bps"] / max(stats['total_swaps'], 1) * 100
-    print(f"Perfect Match Rate (0 bps): {perfect_match_rate:.2f}%")
-    print("=" * 80)
+    sys.stdout.write("\n".join(out) + "\n")
     
     return stats
 
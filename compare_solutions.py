@@ -6,14 +6,108 @@ Analyzes whether we would have won and identifies issues.
 
 import json
 import os
+import multiprocessing
+from functools import lru_cache
 from pathlib import Path
 from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+try:
+    import orjson  # optional: faster parsing of the fully-consumed files
+except ImportError:
+    orjson = None
+
+# Solution files are named <auction_id><SOLUTIONS_SUFFIX>
+SOLUTIONS_SUFFIX = "_solutions.json"
+_SSUF_LEN = len(SOLUTIONS_SUFFIX)
+
+# Token address (lowercase) -> display name
+TOKEN_NAMES = {
+    '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2': 'WETH',
+    '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48': 'USDC',
+}
+
+@lru_cache(maxsize=4096)
+def _token_name(address):
+    """Readable name for a token address."""
+    return TOKEN_NAMES.get(address.lower()) or address[:10]
+
+@dataclass(slots=True)
+class OrderResult:
+    """Outcome of one of our trades, checked against the winner's order."""
+    order_id: str
+    valid: Optional[bool]
+    sell_amount: Any
+    sell_token_name: str
+    required_buy_amount: Any
+    actual_buy_amount: Any
+    buy_token_name: str
+    surplus: int = 0
+    surplus_pct: float = 0
+    deficit: int = 0
+    deficit_pct: float = 0
+
+@dataclass(slots=True)
+class SolutionResult:
+    """Outcome of one of our solutions against the auction's competition."""
+    auction_id: str
+    solution_id: Any
+    num_orders: int
+    gas: int
+    num_competition_solutions: int
+    num_winners: int
+    valid: bool = True
+    invalid_reason: Optional[str] = None
+    matched_winner_order: bool = False
+    winner_ranking: Any = None
+    winner_score: Any = None
+    orders: List[OrderResult] = field(default_factory=list)
+
+def _load_json(path):
+    """Load a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _process_auction(files):
+    """Analyze one (auction_id, solution_file, competition_file) triple.
+    
+    Runs in a worker process and returns (our_solution_count, results, error).
+    """
+    auction_id, solution_file, competition_file = files
+    num_solutions = 0
+    results = []
+    
+    try:
+        our_data = _load_json(solution_file)
+        comp_data = _load_json(competition_file)
+        
+        our_solutions = our_data.get('solutions', [])
+        num_solutions = len(our_solutions)
+        
+        for our_sol in our_solutions:
+            results.append(analyze_solution(auction_id, our_sol, comp_data))
+    
+    except Exception as e:
+        return num_solutions, results, f"Error processing {solution_file.name}: {e}"
+    
+    return num_solutions, results, None
 
 def compare_solutions():
     auction_dir = Path(os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum"))
     
+    # Scan the directory once; competition files are then looked up by name
+    try:
+        with os.scandir(auction_dir) as it:
+            names = {e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        names = set()
+    
     # Find all solution files
-    solution_files = sorted(auction_dir.glob("*_solutions.json"))
+    solution_files = [auction_dir / name for name in sorted(names) if name.endswith(SOLUTIONS_SUFFIX)]
     
     if not solution_files:
         print("No solution files found!")
@@ -33,37 +127,33 @@ def compare_solutions():
     
     detailed_results = []
     
+    pairs = []
     for solution_file in solution_files:
-        auction_id = solution_file.stem.replace("_solutions", "")
-        competition_file = auction_dir / f"{auction_id}_competition.json"
-        
-        if not competition_file.exists():
-            continue
+        auction_id = solution_file.name[:-_SSUF_LEN]
+        competition_name = f"{auction_id}_competition.json"
         
-        try:
-            with open(solution_file, 'r') as f:
-                our_data = json.load(f)
-            
-            with open(competition_file, 'r') as f:
-                comp_data = json.load(f)
-            
-            our_solutions = our_data.get('solutions', [])
-            stats['our_solutions'] += len(our_solutions)
+        if competition_name in names:
+            pairs.append((auction_id, solution_file, auction_dir / competition_name))
+    
+    # Auctions are independent: analyze them in worker processes and merge
+    # the results in file order
+    with multiprocessing.Pool() as pool:
+        for num_solutions, results, error in pool.imap(_process_auction, pairs, chunksize=16):
+            stats['our_solutions'] += num_solutions
             
-            for our_sol in our_solutions:
-                result = analyze_solution(auction_id, our_sol, comp_data)
+            for result in results:
                 detailed_results.append(result)
                 
-                if result['valid']:
+                if result.valid:
                     stats['valid_solutions'] += 1
                 else:
                     stats['invalid_solutions'] += 1
                 
-                if result['matched_winner_order']:
+                if result.matched_winner_order:
                     stats['matched_winner_orders'] += 1
-        
-        except Exception as e:
-            print(f"Error processing {solution_file.name}: {e}")
+            
+            if error:
+                print(error)
     
     # Print summary
     print("=" * 80)
@@ -81,137 +171,124 @@ def compare_solutions():
     print("=" * 80)
     
     for result in detailed_results:
-        print(f"\nAuction {result['auction_id']}:")
-        print(f"  Solution ID: {result['solution_id']}")
-        print(f"  Orders solved: {result['num_orders']}")
-        print(f"  Gas: {result['gas']:,}")
+        print(f"\nAuction {result.auction_id}:")
+        print(f"  Solution ID: {result.solution_id}")
+        print(f"  Orders solved: {result.num_orders}")
+        print(f"  Gas: {result.gas:,}")
         
-        if result['valid']:
+        if result.valid:
             print(f"  ✓ VALID")
         else:
-            print(f"  ✗ INVALID: {result['invalid_reason']}")
+            print(f"  ✗ INVALID: {result.invalid_reason}")
         
-        if result['matched_winner_order']:
-            print(f"  ✓ Solved same order as winner (Ranking {result['winner_ranking']})")
+        if result.matched_winner_order:
+            print(f"  ✓ Solved same order as winner (Ranking {result.winner_ranking})")
         
-        for order_result in result['orders']:
-            print(f"\n    Order: {order_result['order_id'][:20]}...")
-            print(f"      Sell: {order_result['sell_amount']} {order_result['sell_token_name']}")
-            print(f"      Buy Required: {order_result['required_buy_amount']} {order_result['buy_token_name']}")
-            print(f"      Buy Got: {order_result['actual_buy_amount']} {order_result['buy_token_name']}")
+        for order_result in result.orders:
+            print(f"\n    Order: {order_result.order_id[:20]}...")
+            print(f"      Sell: {order_result.sell_amount} {order_result.sell_token_name}")
+            print(f"      Buy Required: {order_result.required_buy_amount} {order_result.buy_token_name}")
+            print(f"      Buy Got: {order_result.actual_buy_amount} {order_result.buy_token_name}")
             
-            if order_result['valid']:
-                print(f"      ✓ Valid - Surplus: {order_result['surplus']:,} ({order_result['surplus_pct']:.4f}%)")
+            if order_result.valid:
+                print(f"      ✓ Valid - Surplus: {order_result.surplus:,} ({order_result.surplus_pct:.4f}%)")
             else:
-                print(f"      ✗ Invalid - Deficit: {order_result['deficit']:,} ({order_result['deficit_pct']:.4f}%)")
+                print(f"      ✗ Invalid - Deficit: {order_result.deficit:,} ({order_result.deficit_pct:.4f}%)")
         
-        print(f"\n  Competition: {result['num_competition_solutions']} solutions, {result['num_winners']} winner(s)")
-        if result['winner_score']:
-            print(f"  Winner score: {result['winner_score']}")
+        print(f"\n  Competition: {result.num_competition_solutions} solutions, {result.num_winners} winner(s)")
+        if result.winner_score:
+            print(f"  Winner score: {result.winner_score}")
     
     return stats, detailed_results
 
 def analyze_solution(auction_id, our_sol, comp_data):
     """Analyze a single solution against competition data."""
-    result = {
-        'auction_id': auction_id,
-        'solution_id': our_sol.get('id'),
-        'num_orders': len(our_sol.get('trades', [])),
-        'gas': our_sol.get('gas', 0),
-        'valid': True,
-        'invalid_reason': None,
-        'matched_winner_order': False,
-        'winner_ranking': None,
-        'winner_score': None,
-        'num_competition_solutions': len(comp_data.get('solutions', [])),
-        'num_winners': len([s for s in comp_data.get('solutions', []) if s.get('isWinner')]),
-        'orders': []
-    }
+    result = SolutionResult(
+        auction_id=auction_id,
+        solution_id=our_sol.get('id'),
+        num_orders=len(our_sol.get('trades', [])),
+        gas=our_sol.get('gas', 0),
+        num_competition_solutions=len(comp_data.get('solutions', [])),
+        num_winners=len([s for s in comp_data.get('solutions', []) if s.get('isWinner')]),
+    )
     
     # Get winners
     winners = [s for s in comp_data.get('solutions', []) if s.get('isWinner')]
     if winners:
-        result['winner_score'] = max(w.get('score', 0) for w in winners)
+        result.winner_score = max(w.get('score', 0) for w in winners)
+    
+    # Order id -> (winner, order), keeping the first winner that solved it
+    winner_index = {}
+    for winner in winners:
+        for w_order in winner.get('orders', []):
+            winner_index.setdefault(w_order['id'], (winner, w_order))
+    
+    # Find corresponding interaction
+    # Simple heuristic: every trade is matched to the first interaction
+    interactions = our_sol.get('interactions', [])
+    interaction = interactions[0] if interactions else None
+    actual_buy = None  # its outputAmount, converted on first use
     
     # Analyze each trade/order
     for trade in our_sol.get('trades', []):
         order_id = trade.get('order')
         
-        # Find corresponding interaction
-        # Match by looking at the input/output tokens and amounts
-        interaction = None
-        for inter in our_sol.get('interactions', []):
-            # Simple heuristic: match if tokens align
-            interaction = inter
-            break
-        
         if not interaction:
-            result['valid'] = False
-            result['invalid_reason'] = "No matching interaction found"
+            result.valid = False
+            result.invalid_reason = "No matching interaction found"
             continue
         
         # Check if this order was solved by a winner
         winner_order = None
-        for winner in winners:
-            for w_order in winner.get('orders', []):
-                if w_order['id'] == order_id:
-                    winner_order = w_order
-                    result['matched_winner_order'] = True
-                    result['winner_ranking'] = winner.get('ranking')
-                    break
-            if winner_order:
-                break
+        match = winner_index.get(order_id)
+        if match:
+            winner, winner_order = match
+            result.matched_winner_order = True
+            result.winner_ranking = winner.get('ranking')
         
         if not winner_order:
             # Can't validate without knowing the order requirements
-            order_result = {
-                'order_id': order_id,
-                'valid': None,
-                'sell_amount': interaction.get('inputAmount'),
-                'sell_token_name': 'Unknown',
-                'required_buy_amount': 'Unknown',
-                'actual_buy_amount': interaction.get('outputAmount'),
-                'buy_token_name': 'Unknown',
-                'surplus': 0,
-                'surplus_pct': 0,
-                'deficit': 0,
-                'deficit_pct': 0,
-            }
-            result['orders'].append(order_result)
+            order_result = OrderResult(
+                order_id=order_id,
+                valid=None,
+                sell_amount=interaction.get('inputAmount'),
+                sell_token_name='Unknown',
+                required_buy_amount='Unknown',
+                actual_buy_amount=interaction.get('outputAmount'),
+                buy_token_name='Unknown',
+            )
+            result.orders.append(order_result)
             continue
         
         # Validate against winner's order
         required_buy = int(winner_order['buyAmount'])
-        actual_buy = int(interaction['outputAmount'])
+        if actual_buy is None:
+            actual_buy = int(interaction['outputAmount'])
         
         order_valid = actual_buy >= required_buy
         
-        sell_token_name = "WETH" if "c02aaa" in winner_order['sellToken'].lower() else \
-                         "USDC" if "a0b869" in winner_order['sellToken'].lower() else \
-                         winner_order['sellToken'][:10]
-        buy_token_name = "WETH" if "c02aaa" in winner_order['buyToken'].lower() else \
-                        "USDC" if "a0b869" in winner_order['buyToken'].lower() else \
-                        winner_order['buyToken'][:10]
-        
-        order_result = {
-            'order_id': order_id,
-            'valid': order_valid,
-            'sell_amount': winner_order['sellAmount'],
-            'sell_token_name': sell_token_name,
-            'required_buy_amount': required_buy,
-            'actual_buy_amount': actual_buy,
-            'buy_token_name': buy_token_name,
-            'surplus': actual_buy - required_buy if order_valid else 0,
-            'surplus_pct': ((actual_buy - required_buy) / required_buy * 100) if order_valid else 0,
-            'deficit': required_buy - actual_buy if not order_valid else 0,
-            'deficit_pct': ((required_buy - actual_buy) / required_buy * 100) if not order_valid else 0,
-        }
-        
-        result['orders'].append(order_result)
+        sell_token_name = _token_name(winner_order['sellToken'])
+        buy_token_name = _token_name(winner_order['buyToken'])
+        
+        order_result = OrderResult(
+            order_id=order_id,
+            valid=order_valid,
+            sell_amount=winner_order['sellAmount'],
+            sell_token_name=sell_token_name,
+            required_buy_amount=required_buy,
+            actual_buy_amount=actual_buy,
+            buy_token_name=buy_token_name,
+            surplus=actual_buy - required_buy if order_valid else 0,
+            surplus_pct=((actual_buy - required_buy) / required_buy * 100) if order_valid else 0,
+            deficit=required_buy - actual_buy if not order_valid else 0,
+            deficit_pct=((required_buy - actual_buy) / required_buy * 100) if not order_valid else 0,
+        )
+        
+        result.orders.append(order_result)
         
         if not order_valid:
-            result['valid'] = False
-            result['invalid_reason'] = f"Order {order_id[:20]}... did not meet minimum buy amount"
+            result.valid = False
+            result.invalid_reason = f"Order {order_id[:20]}... did not meet minimum buy amount"
     
     return result
 
@@ -6,26 +6,43 @@ Shows Balancer pools used, token pairs, pricing, and comprehensive statistics.
 
 import json
 import os
+import pickle
+import sys
+import traceback
+import multiprocessing
+from functools import lru_cache
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, namedtuple
 
+try:
+    import orjson  # optional: faster loading and saving of auction files
+except ImportError:
+    orjson = None
+
+# Token address (lowercase) -> display name
+_TOKEN_MAP = {
+    '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2': 'WETH',
+    '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48': 'USDC',
+    '0x6b175474e89094c44da98b954eedeac495271d0f': 'DAI',
+    '0xdac17f958d2ee523a2206206994597c13d831ec7': 'USDT',
+    '0x2260fac5e5542a773aa44fbcfedf7c193bc2c599': 'WBTC',
+    '0x7fc66500c84a76ad7e9c93437bfc5ac33e2ddae9': 'AAVE',
+    '0x1f9840a85d5af5bf1d1762f925bdaddc4201f984': 'UNI',
+    '0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee': 'ETH',
+}
+
+@lru_cache(maxsize=4096)
 def format_token_name(address):
     """Convert token address to readable name."""
-    address_lower = address.lower()
-    token_map = {
-        '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2': 'WETH',
-        '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48': 'USDC',
-        '0x6b175474e89094c44da98b954eedeac495271d0f': 'DAI',
-        '0xdac17f958d2ee523a2206206994597c13d831ec7': 'USDT',
-        '0x2260fac5e5542a773aa44fbcfedf7c193bc2c599': 'WBTC',
-        '0x7fc66500c84a76ad7e9c93437bfc5ac33e2ddae9': 'AAVE',
-        '0x1f9840a85d5af5bf1d1762f925bdaddc4201f984': 'UNI',
-        '0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee': 'ETH',
-    }
-    return token_map.get(address_lower, address[:10] + '...')
+    return _TOKEN_MAP.get(address.lower(), address[:10] + '...')
 
-def format_amount(amount, decimals=18):
-    """Format token amount with proper decimals."""
+@lru_cache(maxsize=65536)
+def _to_int(amount):
+    """int() of an amount; the same amount strings recur across orders and solutions."""
+    return int(amount)
+
+def _format_amount(amount, decimals):
+    """format_amount without the cache."""
     try:
         val = int(amount) / (10 ** decimals)
         if val >= 1000000:
@@ -37,54 +54,106 @@ def format_amount(amount, decimals=18):
     except:
         return str(amount)
 
-def load_auction_data(auction_dir, auction_id):
-    """Load all data for a given auction."""
-    data = {}
+_format_amount_cached = lru_cache(maxsize=8192)(_format_amount)
+
+def format_amount(amount, decimals=18):
+    """Format token amount with proper decimals."""
+    if type(amount) in (str, int):
+        # Cached by decimal string, so "1" and 1 share an entry
+        return _format_amount_cached(str(amount), decimals)
+    return _format_amount(amount, decimals)
+
+# Input files of an auction, as <auction_id><suffix>
+AUCTION_FILES = {
+    'auction': "_auction.json",
+    'solutions': "_solutions.json",
+    'competition': "_competition.json",
+    'liquidity': "_liquidity.json",
+}
+
+# Below this many auctions to analyze a worker pool costs more to start than it saves
+MIN_FILES_FOR_POOL = 8
+
+# Auction summaries from earlier runs, keyed by absolute solutions file path and
+# reused while none of the auction's input files has changed
+CACHE_FILE = Path.home() / ".cache" / "compare_solutions_detailed.pickle"
+# Bumped whenever the cached summary format changes
+CACHE_VERSION = 2
+
+def load_auction_data(auction_dir, auction_id, names=None):
+    """Load all data for a given auction.
     
-    files = {
-        'auction': f"{auction_id}_auction.json",
-        'solutions': f"{auction_id}_solutions.json",
-        'competition': f"{auction_id}_competition.json",
-        'liquidity': f"{auction_id}_liquidity.json",
-    }
+    names, if given, is the set of file names known to exist in auction_dir
+    and saves checking each input file on disk.
+    """
+    data = {}
     
-    for key, filename in files.items():
+    for key, suffix in AUCTION_FILES.items():
+        filename = f"{auction_id}{suffix}"
         filepath = auction_dir / filename
-        if filepath.exists():
-            with open(filepath, 'r') as f:
-                data[key] = json.load(f)
+        exists = filename in names if names is not None else filepath.exists()
+        if exists:
+            if orjson is not None:
+                data[key] = orjson.loads(filepath.read_bytes())
+            else:
+                with open(filepath, 'r') as f:
+                    data[key] = json.load(f)
         else:
             data[key] = None
     
     return data
 
-def get_pool_info(liquidity_data, pool_id):
-    """Get detailed pool information from liquidity data."""
-    if not liquidity_data:
+# Projection of a liquidity pool used by the analysis and report
+PoolInfo = namedtuple('PoolInfo', 'id kind address balancer_pool_id fee gas_estimate tokens token_count')
+
+def build_pool_index(liquidity_data):
+    """Index the pools in liquidity data by id (first occurrence wins)."""
+    pool_index = {}
+    if liquidity_data:
+        for pool in liquidity_data.get('liquidity', []):
+            pool_index.setdefault(pool.get('id'), pool)
+    return pool_index
+
+def get_pool_info(pool_index, pool_id):
+    """Get detailed pool information from a build_pool_index index."""
+    pool = pool_index.get(pool_id)
+    if pool is None:
         return None
     
-    for pool in liquidity_data.get('liquidity', []):
-        if pool.get('id') == pool_id:
-            return {
-                'id': pool.get('id'),
-                'kind': pool.get('kind', 'unknown'),
-                'address': pool.get('address'),
-                'balancer_pool_id': pool.get('balancerPoolId'),
-                'fee': pool.get('fee'),
-                'gas_estimate': pool.get('gasEstimate'),
-                'tokens': list(pool.get('tokens', {}).keys()),
-                'token_count': len(pool.get('tokens', {})),
-            }
+    tokens = pool.get('tokens', {})
+    return PoolInfo(
+        id=pool.get('id'),
+        kind=pool.get('kind', 'unknown'),
+        address=pool.get('address'),
+        balancer_pool_id=pool.get('balancerPoolId'),
+        fee=pool.get('fee'),
+        gas_estimate=pool.get('gasEstimate'),
+        tokens=list(tokens.keys()),
+        token_count=len(tokens),
+    )
+
+def extract_auction_inputs(data):
+    """Pull out of the raw auction data only what analyze_solution_detailed uses.
     
-    return None
+    Returns (our_sol, auction_orders, winner_orders, pool_index), or None if
+    there is no solution of ours to analyze; winner orders map order id ->
+    (order, winner).
+    """
+    solutions = data['solutions'].get('solutions') or ()
+    if not solutions:
+        return None
+    our_sol = solutions[0]
+    auction_orders = {o['uid']: o for o in data['auction'].get('orders', [])}
+    winner_orders = {
+        order['id']: (order, winner)
+        for winner in data['competition'].get('solutions', ()) if winner.get('isWinner')
+        for order in winner.get('orders', ())
+    }
+    pool_index = build_pool_index(data['liquidity'])
+    return our_sol, auction_orders, winner_orders, pool_index
 
-def analyze_solution_detailed(auction_id, data):
+def analyze_solution_detailed(auction_id, our_sol, auction_orders, winner_orders, pool_index):
     """Perform detailed analysis of a solution."""
-    our_sol = data['solutions'].get('solutions', [{}])[0]
-    auction_orders = {o['uid']: o for o in data['auction'].get('orders', [])}
-    comp_data = data['competition']
-    liquidity_data = data['liquidity']
-    
     result = {
         'auction_id': auction_id,
         'solution_id': our_sol.get('id'),
@@ -92,51 +161,50 @@ def analyze_solution_detailed(auction_id, data):
         'num_interactions': len(our_sol.get('interactions', [])),
         'num_trades': len(our_sol.get('trades', [])),
         'prices': our_sol.get('prices', {}),
-        'interactions': [],
+        'interactions': [],  # already in the saved JSON shape
+        'pool_infos': [],    # PoolInfo (or None) per interaction, for the report
         'trades': [],
-        'pool_stats': {},
+        'pool_stats': Counter(),
         'valid': True,
         'competitive': False,
         'beat_winner': False,
     }
     
-    # Get winners
-    winners = [s for s in comp_data.get('solutions', []) if s.get('isWinner')]
-    winner_orders = {}
-    for winner in winners:
-        for order in winner.get('orders', []):
-            winner_orders[order['id']] = {
-                'order': order,
-                'winner': winner,
-            }
-    
     # Analyze interactions (pool usage)
     for interaction in our_sol.get('interactions', []):
         pool_id = interaction.get('id')
-        pool_info = get_pool_info(liquidity_data, pool_id)
+        pool_info = get_pool_info(pool_index, pool_id)
         
         interaction_detail = {
             'pool_id': pool_id,
-            'pool_info': pool_info,
+            'pool_kind': pool_info.kind if pool_info else 'unknown',
+            'pool_address': pool_info.address if pool_info else None,
+            'pool_fee': pool_info.fee if pool_info else None,
             'input_token': interaction.get('inputToken'),
-            'output_token': interaction.get('outputToken'),
-            'input_amount': interaction.get('inputAmount'),
-            'output_amount': interaction.get('outputAmount'),
             'input_token_name': format_token_name(interaction.get('inputToken', '')),
+            'input_amount': interaction.get('inputAmount'),
+            'output_token': interaction.get('outputToken'),
             'output_token_name': format_token_name(interaction.get('outputToken', '')),
+            'output_amount': interaction.get('outputAmount'),
             'kind': interaction.get('kind'),
             'internalize': interaction.get('internalize'),
         }
         
         result['interactions'].append(interaction_detail)
+        result['pool_infos'].append(pool_info)
         
         # Track pool usage stats
         if pool_info:
-            pool_kind = pool_info['kind']
-            if pool_kind not in result['pool_stats']:
-                result['pool_stats'][pool_kind] = 0
+            pool_kind = pool_info.kind
             result['pool_stats'][pool_kind] += 1
     
+    # Output amount of the first interaction producing each token (lowercase address)
+    output_by_token = {}
+    for interaction in result['interactions']:
+        output_token = interaction['output_token']
+        if output_token:
+            output_by_token.setdefault(output_token.lower(), interaction['output_amount'])
+    
     # Analyze trades (orders fulfilled)
     for trade in our_sol.get('trades', []):
         order_id = trade.get('order')
@@ -149,15 +217,15 @@ def analyze_solution_detailed(auction_id, data):
         trade_detail = {
             'order_id': order_id,
             'kind': trade.get('kind'),
-            'executed_amount': int(trade.get('executedAmount', 0)),
-            'fee': int(trade.get('fee', 0)),
+            'executed_amount': _to_int(trade.get('executedAmount', 0)),
+            'fee': _to_int(trade.get('fee', 0)),
         }
         
         # Get order requirements
         sell_token = auction_order['sellToken']
         buy_token = auction_order['buyToken']
-        sell_amount = int(auction_order['sellAmount'])
-        buy_amount_min = int(auction_order['buyAmount'])
+        sell_amount = _to_int(auction_order['sellAmount'])
+        buy_amount_min = _to_int(auction_order['buyAmount'])
         is_partially_fillable = auction_order.get('partiallyFillable', False)
         executed_amount = trade_detail['executed_amount']
         
@@ -181,12 +249,10 @@ def analyze_solution_detailed(auction_id, data):
             'effective_buy_min': effective_buy_min,
         })
         
-        # Find our actual output from interactions
-        our_output = 0
-        for interaction in result['interactions']:
-            if interaction['output_token'] == buy_token:
-                our_output = int(interaction['output_amount'])
-                break
+        # Find our actual output from interactions; a matched interaction
+        # without an amount fails the auction rather than reading as 0
+        buy_key = buy_token.lower()
+        our_output = _to_int(output_by_token[buy_key]) if buy_key in output_by_token else 0
         
         trade_detail['our_output'] = our_output
         trade_detail['valid'] = our_output >= effective_buy_min
@@ -195,9 +261,10 @@ def analyze_solution_detailed(auction_id, data):
         
         # Compare with winner
         if winner_info:
-            winner_output = int(winner_info['order']['buyAmount'])
-            winner_ranking = winner_info['winner'].get('ranking')
-            winner_score = winner_info['winner'].get('score')
+            winner_order, winner = winner_info
+            winner_output = _to_int(winner_order['buyAmount'])
+            winner_ranking = winner.get('ranking')
+            winner_score = winner.get('score')
             
             trade_detail.update({
                 'winner_output': winner_output,
@@ -221,135 +288,163 @@ def analyze_solution_detailed(auction_id, data):
     
     return result
 
-def print_detailed_analysis(results):
-    """Print comprehensive analysis with all details."""
+def render_auction_details(result):
+    """Render the detailed analysis block for one auction."""
+    lines = []
+    auction_id = result['auction_id']
+    
+    lines.append(f"\n{'┌' + '─' * 98 + '┐'}")
+    lines.append(f"│ {'Auction ' + auction_id:^97s}│")
+    lines.append(f"{'└' + '─' * 98 + '┘'}")
+    
+    # Status
+    status_symbols = []
+    if result['valid']:
+        status_symbols.append("✓ VALID")
+    else:
+        status_symbols.append("✗ INVALID")
+    
+    if result['beat_winner']:
+        status_symbols.append("🏆 BEAT WINNER")
+    
+    lines.append(f"Status: {' | '.join(status_symbols)}")
+    lines.append(f"Solution ID: {result['solution_id']} | Gas: {result['gas']:,}")
+    
+    # Pool usage
+    lines.append(f"\n{'POOLS USED':^100}")
+    lines.append("-" * 100)
+    for interaction, pool_info in zip(result['interactions'], result['pool_infos']):
+        if pool_info:
+            lines.append(f"Pool {interaction['pool_id']:>3s}: {pool_info.kind:>15s}")
+            lines.append(f"  Address: {pool_info.address}")
+            lines.append(f"  Balancer Pool ID: {pool_info.balancer_pool_id}")
+            lines.append(f"  Fee: {pool_info.fee}")
+            lines.append(f"  Tokens: {pool_info.token_count} tokens")
+            lines.append(f"  Route: {interaction['input_token_name']} ({format_amount(interaction['input_amount'])}) → "
+                         f"{interaction['output_token_name']} ({format_amount(interaction['output_amount'])})")
+        else:
+            lines.append(f"Pool {interaction['pool_id']}: [Info not available]")
+            lines.append(f"  Route: {interaction['input_token_name']} → {interaction['output_token_name']}")
+    
+    # Trade results
+    lines.append(f"\n{'TRADE RESULTS':^100}")
+    lines.append("-" * 100)
+    for trade in result['trades']:
+        lines.append(f"Order: {trade['order_id'][:30]}...")
+        lines.append(f"  Trade: Sell {format_amount(trade['sell_amount'])} {trade['sell_token_name']} → "
+                     f"Buy {trade['buy_token_name']}")
+        lines.append(f"  User Minimum:        {trade['buy_amount_required']:>20,}")
+        lines.append(f"  Our Output:          {trade['our_output']:>20,}")
+        
+        if trade['valid']:
+            lines.append(f"  Surplus vs Min:      {trade['surplus_vs_min']:>+20,} ({trade['surplus_vs_min_pct']:>+6.2f}%) ✓")
+        else:
+            lines.append(f"  Deficit vs Min:      {trade['surplus_vs_min']:>+20,} ({trade['surplus_vs_min_pct']:>+6.2f}%) ✗")
+        
+        if 'winner_output' in trade:
+            lines.append(f"  Winner Output:       {trade['winner_output']:>20,} (Rank {trade['winner_ranking']})")
+            lines.append(f"  Diff vs Winner:      {trade['diff_vs_winner']:>+20,} ({trade['diff_vs_winner_pct']:>+6.2f}%) "
+                         + ("🏆" if trade['beat_winner'] else ""))
+        
+        lines.append(f"  Executed Amount:     {trade['executed_amount']:>20,}")
+        lines.append(f"  Fee Charged:         {trade['fee']:>20,}")
+    
+    # Prices
+    if result['prices']:
+        lines.append(f"\n{'CLEARING PRICES':^100}")
+        lines.append("-" * 100)
+        for token, price in result['prices'].items():
+            token_name = format_token_name(token)
+            lines.append(f"  {token_name:>8s}: {price}")
+    
+    return "\n".join(lines)
+
+def render_summary_row(result):
+    """Render one auction's row of the performance summary table."""
+    valid_str = "✓" if result['valid'] else "✗"
+    beat_str = "✓" if result['beat_winner'] else "✗"
+    
+    surplus_pct = "N/A"
+    pool_type = "N/A"
+    winner_rank = "N/A"
+    
+    if result['trades']:
+        trade = result['trades'][0]
+        surplus_pct = f"{trade['surplus_vs_min_pct']:+6.2f}%"
+        if 'winner_ranking' in trade:
+            winner_rank = f"Rank {trade['winner_ranking']}"
+    
+    if result['pool_stats']:
+        pool_type = list(result['pool_stats'].keys())[0]
+    
+    return f"{result['auction_id']:<12} {valid_str:>7} {beat_str:>7} {surplus_pct:>10} {pool_type:>15} {winner_rank:>12}"
+
+def summarize_result(result):
+    """Reduce an analysis result to what print_detailed_analysis needs.
+    
+    The report text is rendered right away so the full result (and the raw
+    auction data behind it) can be dropped while later auctions are analyzed.
+    """
+    return {
+        'valid': result['valid'],
+        'competitive': result['competitive'],
+        'beat_winner': result['beat_winner'],
+        'pool_stats': result['pool_stats'],
+        'details': render_auction_details(result),
+        'summary_row': render_summary_row(result),
+    }
+
+def print_detailed_analysis(summaries):
+    """Print comprehensive analysis from summarize_result summaries."""
     
     # Overall statistics
-    total = len(results)
-    valid = sum(1 for r in results if r['valid'])
-    competitive = sum(1 for r in results if r['competitive'])
-    beat_winner = sum(1 for r in results if r['beat_winner'])
+    total = len(summaries)
+    valid = sum(1 for r in summaries if r['valid'])
+    competitive = sum(1 for r in summaries if r['competitive'])
+    beat_winner = sum(1 for r in summaries if r['beat_winner'])
     
     # Pool statistics
     all_pool_types = Counter()
-    for result in results:
-        for pool_type, count in result['pool_stats'].items():
-            all_pool_types[pool_type] += count
+    for summary in summaries:
+        all_pool_types.update(summary['pool_stats'])
     
-    print("=" * 100)
-    print("COMPREHENSIVE SOLUTION ANALYSIS")
-    print("=" * 100)
-    print(f"\n{'OVERALL STATISTICS':^100}")
-    print("-" * 100)
-    print(f"Total Auctions:              {total}")
-    print(f"Valid Solutions:             {valid:3d} ({valid/total*100:5.1f}%) - Can execute on-chain")
-    print(f"Competitive Solutions:       {competitive:3d} ({competitive/total*100:5.1f}%) - Valid AND beat winner")
-    print(f"Beat Winner:                 {beat_winner:3d} ({beat_winner/total*100:5.1f}%) - Provided more output")
-    
-    print(f"\n{'BALANCER POOL USAGE':^100}")
-    print("-" * 100)
+    # Build the whole report and write it out in one go
+    out = []
+    out.append("=" * 100)
+    out.append("COMPREHENSIVE SOLUTION ANALYSIS")
+    out.append("=" * 100)
+    out.append(f"\n{'OVERALL STATISTICS':^100}")
+    out.append("-" * 100)
+    out.append(f"Total Auctions:              {total}")
+    out.append(f"Valid Solutions:             {valid:3d} ({valid/total*100:5.1f}%) - Can execute on-chain")
+    out.append(f"Competitive Solutions:       {competitive:3d} ({competitive/total*100:5.1f}%) - Valid AND beat winner")
+    out.append(f"Beat Winner:                 {beat_winner:3d} ({beat_winner/total*100:5.1f}%) - Provided more output")
+    
+    out.append(f"\n{'BALANCER POOL USAGE':^100}")
+    out.append("-" * 100)
     total_pool_usages = sum(all_pool_types.values())
     for pool_type, count in all_pool_types.most_common():
         pct = count / total_pool_usages * 100
-        print(f"{pool_type:20s}: {count:3d} uses ({pct:5.1f}%)")
+        out.append(f"{pool_type:20s}: {count:3d} uses ({pct:5.1f}%)")
     
-    print(f"\n{'=' * 100}")
-    print("DETAILED AUCTION ANALYSIS")
-    print("=" * 100)
+    out.append(f"\n{'=' * 100}")
+    out.append("DETAILED AUCTION ANALYSIS")
+    out.append("=" * 100)
     
-    for result in results:
-        auction_id = result['auction_id']
-        
-        print(f"\n{'┌' + '─' * 98 + '┐'}")
-        print(f"│ {'Auction ' + auction_id:^97s}│")
-        print(f"{'└' + '─' * 98 + '┘'}")
-        
-        # Status
-        status_symbols = []
-        if result['valid']:
-            status_symbols.append("✓ VALID")
-        else:
-            status_symbols.append("✗ INVALID")
-        
-        if result['beat_winner']:
-            status_symbols.append("🏆 BEAT WINNER")
-        
-        print(f"Status: {' | '.join(status_symbols)}")
-        print(f"Solution ID: {result['solution_id']} | Gas: {result['gas']:,}")
-        
-        # Pool usage
-        print(f"\n{'POOLS USED':^100}")
-        print("-" * 100)
-        for interaction in result['interactions']:
-            pool_info = interaction['pool_info']
-            if pool_info:
-                print(f"Pool {interaction['pool_id']:>3s}: {pool_info['kind']:>15s}")
-                print(f"  Address: {pool_info['address']}")
-                print(f"  Balancer Pool ID: {pool_info['balancer_pool_id']}")
-                print(f"  Fee: {pool_info['fee']}")
-                print(f"  Tokens: {pool_info['token_count']} tokens")
-                print(f"  Route: {interaction['input_token_name']} ({format_amount(interaction['input_amount'])}) → "
-                      f"{interaction['output_token_name']} ({format_amount(interaction['output_amount'])})")
-            else:
-                print(f"Pool {interaction['pool_id']}: [Info not available]")
-                print(f"  Route: {interaction['input_token_name']} → {interaction['output_token_name']}")
-        
-        # Trade results
-        print(f"\n{'TRADE RESULTS':^100}")
-        print("-" * 100)
-        for trade in result['trades']:
-            print(f"Order: {trade['order_id'][:30]}...")
-            print(f"  Trade: Sell {format_amount(trade['sell_amount'])} {trade['sell_token_name']} → "
-                  f"Buy {trade['buy_token_name']}")
-            print(f"  User Minimum:        {trade['buy_amount_required']:>20,}")
-            print(f"  Our Output:          {trade['our_output']:>20,}")
-            
-            if trade['valid']:
-                print(f"  Surplus vs Min:      {trade['surplus_vs_min']:>+20,} ({trade['surplus_vs_min_pct']:>+6.2f}%) ✓")
-            else:
-                print(f"  Deficit vs Min:      {trade['surplus_vs_min']:>+20,} ({trade['surplus_vs_min_pct']:>+6.2f}%) ✗")
-            
-            if 'winner_output' in trade:
-                print(f"  Winner Output:       {trade['winner_output']:>20,} (Rank {trade['winner_ranking']})")
-                print(f"  Diff vs Winner:      {trade['diff_vs_winner']:>+20,} ({trade['diff_vs_winner_pct']:>+6.2f}%)",
-                      "🏆" if trade['beat_winner'] else "")
-            
-            print(f"  Executed Amount:     {trade['executed_amount']:>20,}")
-            print(f"  Fee Charged:         {trade['fee']:>20,}")
-        
-        # Prices
-        if result['prices']:
-            print(f"\n{'CLEARING PRICES':^100}")
-            print("-" * 100)
-            for token, price in result['prices'].items():
-                token_name = format_token_name(token)
-                print(f"  {token_name:>8s}: {price}")
+    for summary in summaries:
+        out.append(summary['details'])
     
     # Summary table
-    print(f"\n{'=' * 100}")
-    print(f"{'PERFORMANCE SUMMARY TABLE':^100}")
-    print("=" * 100)
-    print(f"{'Auction':<12} {'Valid':>7} {'Beat':>7} {'Surplus%':>10} {'Pool Type':>15} {'Winner Rank':>12}")
-    print("-" * 100)
+    out.append(f"\n{'=' * 100}")
+    out.append(f"{'PERFORMANCE SUMMARY TABLE':^100}")
+    out.append("=" * 100)
+    out.append(f"{'Auction':<12} {'Valid':>7} {'Beat':>7} {'Surplus%':>10} {'Pool Type':>15} {'Winner Rank':>12}")
+    out.append("-" * 100)
     
-    for result in results:
-        valid_str = "✓" if result['valid'] else "✗"
-        beat_str = "✓" if result['beat_winner'] else "✗"
-        
-        surplus_pct = "N/A"
-        pool_type = "N/A"
-        winner_rank = "N/A"
-        
-        if result['trades']:
-            trade = result['trades'][0]
-            surplus_pct = f"{trade['surplus_vs_min_pct']:+6.2f}%"
-            if 'winner_ranking' in trade:
-                winner_rank = f"Rank {trade['winner_ranking']}"
-        
-        if result['pool_stats']:
-            pool_type = list(result['pool_stats'].keys())[0]
-        
-        print(f"{result['auction_id']:<12} {valid_str:>7} {beat_str:>7} {surplus_pct:>10} {pool_type:>15} {winner_rank:>12}")
+    for summary in summaries:
+        out.append(summary['summary_row'])
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def save_analysis_to_json(result, auction_dir):
     """Save detailed analysis for a single auction to JSON file."""
@@ -368,23 +463,7 @@ def save_analysis_to_json(result, auction_dir):
         'beat_winner': result['beat_winner'],
         'prices': result['prices'],
         'pool_stats': result['pool_stats'],
-        'interactions': [
-            {
-                'pool_id': i['pool_id'],
-                'pool_kind': i['pool_info']['kind'] if i['pool_info'] else 'unknown',
-                'pool_address': i['pool_info']['address'] if i['pool_info'] else None,
-                'pool_fee': i['pool_info']['fee'] if i['pool_info'] else None,
-                'input_token': i['input_token'],
-                'input_token_name': i['input_token_name'],
-                'input_amount': i['input_amount'],
-                'output_token': i['output_token'],
-                'output_token_name': i['output_token_name'],
-                'output_amount': i['output_amount'],
-                'kind': i['kind'],
-                'internalize': i['internalize'],
-            }
-            for i in result['interactions']
-        ],
+        'interactions': result['interactions'],
         'trades': [
             {
                 'order_id': t['order_id'],
@@ -413,16 +492,106 @@ def save_analysis_to_json(result, auction_dir):
         ]
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(json_result, f, indent=2)
+    if orjson is not None:
+        buf = orjson.dumps(json_result, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(json_result, indent=2).encode()
+    
+    # Leave an unchanged analysis alone so its mtime and page cache survive
+    try:
+        if output_file.read_bytes() == buf:
+            return output_file
+    except OSError:
+        pass
+    output_file.write_bytes(buf)
     
     return output_file
 
-def compare_solutions_detailed():
-    auction_dir = Path(os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum"))
+def _input_signature(entries, auction_id):
+    """(mtime_ns, size) of each input file of an auction, None if missing.
+    
+    entries maps file name -> os.DirEntry for the auction directory.
+    """
+    signature = []
+    for suffix in AUCTION_FILES.values():
+        entry = entries.get(f"{auction_id}{suffix}")
+        if entry is None:
+            signature.append(None)
+        else:
+            st = entry.stat()
+            signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+def _load_cache():
+    """Load the auction summaries cache, or an empty one."""
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            version, cache = pickle.load(f)
+    except Exception:
+        return {}
+    return cache if version == CACHE_VERSION and isinstance(cache, dict) else {}
+
+def _save_cache(cache):
+    """Write the auction summaries cache; failures only cost the next run time."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((CACHE_VERSION, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: could not write cache {CACHE_FILE}: {e}")
+
+def _process_one(job):
+    """Load, analyze and save one auction; runs in a worker process.
+    
+    job is (auction_id, auction_dir, names), names being the auction's input
+    files that exist. Returns (summary, output_file, error):
+    summary is None for auctions missing input files or a solution, and error holds the
+    message and traceback text if processing failed.
+    """
+    auction_id, auction_dir, names = job
+    try:
+        data = load_auction_data(auction_dir, auction_id, names)
+        
+        if not all([data['solutions'], data['auction'], data['competition']]):
+            return None, None, None
+        
+        inputs = extract_auction_inputs(data)
+        del data  # only the extracted slices are needed from here on
+        
+        if inputs is None:
+            return None, None, None
+        
+        result = analyze_solution_detailed(auction_id, *inputs)
+        
+        # Save to JSON file
+        output_file = save_analysis_to_json(result, auction_dir)
+        
+        # Keep only the rendered report and counters, not the full result
+        return summarize_result(result), output_file, None
+    
+    except Exception as e:
+        return None, None, (f"Error processing {auction_id}: {e}", traceback.format_exc())
+
+def compare_solutions_detailed(auction_dir=None, force=False):
+    """Analyze every auction in auction_dir (default: $AUCTION_DIR).
+    
+    With force, cached results from earlier runs are ignored.
+    """
+    if auction_dir is None:
+        auction_dir = os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum")
+    auction_dir = Path(auction_dir)
+    
+    # Scan the directory once; input and analysis files are then looked up by name
+    try:
+        with os.scandir(auction_dir) as it:
+            entries = {e.name: e for e in it if e.is_file()}
+    except FileNotFoundError:
+        entries = {}
     
     # Find all solution files
-    solution_files = sorted(auction_dir.glob("*_solutions.json"))
+    solution_files = [auction_dir / name for name in sorted(entries) if name.endswith("_solutions.json")]
     
     if not solution_files:
         print("No solution files found!")
@@ -430,31 +599,63 @@ def compare_solutions_detailed():
     
     print(f"Loading and analyzing {len(solution_files)} auctions...\n")
     
-    results = []
+    summaries = []
     saved_files = []
+    cache = _load_cache()
+    cache_updated = False
     
+    # Reuse the previous analysis if no input changed and its file is still
+    # there; everything else is analyzed, in worker processes when there is
+    # enough of it
+    directory = os.path.abspath(auction_dir)
+    jobs = []
     for solution_file in solution_files:
         auction_id = solution_file.stem.replace("_solutions", "")
-        
-        try:
-            data = load_auction_data(auction_dir, auction_id)
-            
-            if not all([data['solutions'], data['auction'], data['competition']]):
+        key = os.path.join(directory, solution_file.name)
+        signature = _input_signature(entries, auction_id)
+        entry = cache.get(key)
+        output_name = f"{auction_id}_analysis.json"
+        if not force and entry is not None and entry[0] == signature and output_name in entries:
+            jobs.append((key, signature, entry[1], auction_dir / output_name, None))
+        else:
+            names = frozenset(f"{auction_id}{suffix}" for suffix in AUCTION_FILES.values()
+                              if f"{auction_id}{suffix}" in entries)
+            jobs.append((key, signature, None, None, (auction_id, auction_dir, names)))
+    
+    work_items = [job[4] for job in jobs if job[4] is not None]
+    if len(work_items) < MIN_FILES_FOR_POOL:
+        fresh = map(_process_one, work_items)
+    else:
+        with multiprocessing.Pool() as pool:
+            fresh = iter(pool.map(_process_one, work_items, chunksize=8))
+    
+    for key, signature, summary, output_file, work in jobs:
+        if work is not None:
+            summary, output_file, error = next(fresh)
+            if error is not None:
+                message, details = error
+                print(message)
+                sys.stderr.write(details)
                 continue
-            
-            result = analyze_solution_detailed(auction_id, data)
-            results.append(result)
-            
-            # Save to JSON file
-            output_file = save_analysis_to_json(result, auction_dir)
-            saved_files.append(output_file)
+            if summary is None:
+                continue
+            cache[key] = (signature, summary)
+            cache_updated = True
         
-        except Exception as e:
-            print(f"Error processing {auction_id}: {e}")
-            import traceback
-            traceback.print_exc()
+        summaries.append(summary)
+        saved_files.append(output_file)
+    
+    # Forget auctions of this directory whose solutions file has since been removed
+    listed = {job[0] for job in jobs}
+    removed = [key for key in cache
+               if key not in listed and os.path.dirname(key) == directory]
+    for key in removed:
+        del cache[key]
+    
+    if cache_updated or removed:
+        _save_cache(cache)
     
-    print_detailed_analysis(results)
+    print_detailed_analysis(summaries)
     
     # Print saved files summary
     print(f"\n{'=' * 100}")
@@ -465,8 +666,8 @@ def compare_solutions_detailed():
     for filepath in saved_files:
         print(f"  ✓ {filepath.name}")
     
-    return results
+    return summaries
 
 if __name__ == "__main__":
-    results = compare_solutions_detailed()
+    summaries = compare_solutions_detailed(force="--force" in sys.argv[1:])
 
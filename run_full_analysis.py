@@ -11,14 +11,38 @@ This script:
 6. Saves results to timestamped output directory
 """
 
+import io
 import json
 import os
+import signal
 import sys
-import subprocess
+import traceback
+import multiprocessing
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
+try:
+    import ijson  # optional: stop reading a solution file at its first solution
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster parsing and report writing
+except ImportError:
+    orjson = None
+
+# Pipeline steps run in-process rather than as child interpreters
+import check_verification
+import compare_solutions_detailed
+
+# Columns of the per-pool rows accumulated in generate_summary_report
+_COUNT, _WINS, _TYPE, _VERSION, _FEE = range(5)
+
+# Longest the analysis and verification steps may run, in seconds
+STEP_TIMEOUT = 300
+
 def print_header(title, width=100):
     """Print a nice header."""
     print("\n" + "=" * width)
@@ -30,11 +54,84 @@ def print_section(title, width=100):
     print(f"\n{title}")
     print("-" * width)
 
-def check_solutions(auction_dir):
-    """Check which auction files have solutions."""
+@contextmanager
+def _time_limit(seconds):
+    """Raise TimeoutError in the block once seconds have passed.
+    
+    Uses SIGALRM, so it only limits anything on platforms that have
+    signal.setitimer; worker processes are stopped when their pool exits.
+    """
+    if not hasattr(signal, 'setitimer'):
+        yield
+        return
+    
+    def expire(signum, frame):
+        raise TimeoutError
+    
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def _scan_dir(auction_dir):
+    """Map file name -> os.DirEntry for one listing of the auction directory."""
+    with os.scandir(auction_dir) as it:
+        return {e.name: e for e in it}
+
+def _load_json(path):
+    """Parse one JSON file."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def _solutions_from_events(events):
+    """Whether a solution file has solutions, from its ijson.parse events.
+    
+    Stops at the first solution. The top-level value must be an object
+    and 'solutions', when present, a list or null (counted as empty, as
+    .get would); any other shape raises ValueError.
+    """
+    _, event, _ = next(events)
+    if event != 'start_map':
+        raise ValueError(f"expected a JSON object, got {event}")
+    
+    for prefix, event, _ in events:
+        if prefix == 'solutions':
+            if event == 'null':
+                return False
+            if event != 'start_array':
+                raise ValueError(f"'solutions' is not a list, got {event}")
+            _, event, _ = next(events)
+            return event != 'end_array'
+    return False
+
+def _probe_solution_file(solution_file):
+    """Read one solution file and return (has_solutions, error)."""
+    try:
+        if ijson is not None:
+            with open(solution_file, 'rb') as f:
+                return _solutions_from_events(ijson.parse(f)), None
+        
+        data = _load_json(solution_file)
+        return bool(data.get('solutions', [])), None
+    except Exception as e:
+        return False, str(e)
+
+def check_solutions(auction_dir, entries):
+    """Check which auction files have solutions.
+    
+    entries is the directory listing from _scan_dir.
+    """
     print_header("STEP 1: SCANNING FOR SOLUTIONS")
     
-    solution_files = sorted(auction_dir.glob("*_solutions.json"))
+    solution_files = sorted(
+        auction_dir / name for name in entries if name.endswith("_solutions.json")
+    )
     
     stats = {
         'total': len(solution_files),
@@ -47,38 +144,40 @@ def check_solutions(auction_dir):
     
     print(f"Scanning {stats['total']} solution files...")
     
-    for solution_file in solution_files:
-        # Skip enhanced solutions
-        if 'enhanced' in solution_file.name:
-            continue
-            
-        auction_id = solution_file.stem.replace('_solutions', '')
+    # Skip enhanced solutions
+    solution_files = [f for f in solution_files if 'enhanced' not in f.name]
+    
+    # Files are independent, so parse them across all cores
+    with multiprocessing.Pool() as pool:
+        results = pool.imap(_probe_solution_file, solution_files, chunksize=64)
         
-        try:
-            with open(solution_file) as f:
-                data = json.load(f)
-                solutions = data.get('solutions', [])
-                
-                if solutions and len(solutions) > 0:
-                    stats['with_solutions'] += 1
-                    stats['auction_ids'].append(auction_id)
-                else:
-                    stats['empty'] += 1
-                    stats['empty_auction_ids'].append(auction_id)
-        except Exception as e:
-            stats['errors'] += 1
-            print(f"  ✗ Error reading {solution_file.name}: {e}")
+        for solution_file, (has_solutions, error) in zip(solution_files, results):
+            auction_id = solution_file.stem.replace('_solutions', '')
+            
+            if error is not None:
+                stats['errors'] += 1
+                print(f"  ✗ Error reading {solution_file.name}: {error}")
+            elif has_solutions:
+                stats['with_solutions'] += 1
+                stats['auction_ids'].append(auction_id)
+            else:
+                stats['empty'] += 1
+                stats['empty_auction_ids'].append(auction_id)
     
     print_section("SOLUTION SCAN RESULTS")
+    denom = max(stats['total'], 1)
     print(f"Total solution files:        {stats['total']:>6}")
-    print(f"With solutions:              {stats['with_solutions']:>6} ({stats['with_solutions']/max(stats['total'],1)*100:.1f}%)")
-    print(f"Empty (no solutions):        {stats['empty']:>6} ({stats['empty']/max(stats['total'],1)*100:.1f}%)")
+    print(f"With solutions:              {stats['with_solutions']:>6} ({stats['with_solutions']/denom*100:.1f}%)")
+    print(f"Empty (no solutions):        {stats['empty']:>6} ({stats['empty']/denom*100:.1f}%)")
     print(f"Errors reading file:         {stats['errors']:>6}")
     
     return stats
 
-def cleanup_empty_auctions(auction_dir, empty_auction_ids):
-    """Remove auction files that don't have solutions."""
+def cleanup_empty_auctions(auction_dir, empty_auction_ids, entries):
+    """Remove auction files that don't have solutions.
+    
+    entries is the directory listing from _scan_dir.
+    """
     print_header("STEP 2: CLEANING UP EMPTY AUCTION FILES")
     
     if not empty_auction_ids:
@@ -102,17 +201,20 @@ def cleanup_empty_auctions(auction_dir, empty_auction_ids):
     removed_count = 0
     total_size = 0
     
+    # Look candidates up in the listing instead of probing each file
     for auction_id in empty_auction_ids:
         for pattern in file_patterns:
-            file_path = auction_dir / f"{auction_id}{pattern}"
-            if file_path.exists():
+            entry = entries.get(f"{auction_id}{pattern}")
+            if entry is not None:
                 try:
-                    size = file_path.stat().st_size
-                    file_path.unlink()
+                    size = entry.stat().st_size
+                    os.unlink(entry.path)
                     removed_count += 1
                     total_size += size
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
-                    print(f"  ✗ Error removing {file_path.name}: {e}")
+                    print(f"  ✗ Error removing {entry.name}: {e}")
     
     # Convert size to human readable
     if total_size < 1024:
@@ -129,8 +231,11 @@ def cleanup_empty_auctions(auction_dir, empty_auction_ids):
     
     return removed_count
 
-def check_required_files(auction_dir, auction_ids):
-    """Check which auctions have all required files for analysis."""
+def check_required_files(auction_dir, auction_ids, entries):
+    """Check which auctions have all required files for analysis.
+    
+    entries is the directory listing from _scan_dir.
+    """
     print_header("STEP 3: CHECKING REQUIRED FILES")
     
     required_suffixes = ['_auction.json', '_competition.json', '_liquidity.json', '_solutions.json']
@@ -141,8 +246,7 @@ def check_required_files(auction_dir, auction_ids):
     for auction_id in auction_ids:
         has_all = True
         for suffix in required_suffixes:
-            file_path = auction_dir / f"{auction_id}{suffix}"
-            if not file_path.exists():
+            if f"{auction_id}{suffix}" not in entries:
                 has_all = False
                 missing_files[auction_id].append(suffix)
         
@@ -163,38 +267,34 @@ def check_required_files(auction_dir, auction_ids):
     return valid_auctions
 
 def generate_analysis(auction_dir, auction_ids):
-    """Generate detailed analysis JSON files."""
+    """Generate detailed analysis JSON files.
+    
+    Returns a fresh _scan_dir listing that includes the new analysis files,
+    or None if the analysis failed.
+    """
     print_header("STEP 4: GENERATING DETAILED ANALYSIS")
     
     print(f"Generating analysis for {len(auction_ids)} auctions...")
     print("This may take a moment...\n")
     
+    # Only the analysis files matter here, so its printed report is discarded
+    errors = io.StringIO()
     try:
-        # Run the detailed comparison script (from the parent directory)
-        script_dir = Path(__file__).parent
-        result = subprocess.run(
-            ['python3', str(script_dir / 'compare_solutions_detailed.py')],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        if result.returncode != 0:
-            print(f"✗ Error running analysis script:")
-            print(result.stderr)
-            return False
-        
-        # Count generated files
-        analysis_files = list(auction_dir.glob("*_analysis.json"))
-        print(f"✓ Generated {len(analysis_files)} analysis files")
-        return True
-        
-    except subprocess.TimeoutExpired:
+        with _time_limit(STEP_TIMEOUT), redirect_stdout(io.StringIO()), redirect_stderr(errors):
+            compare_solutions_detailed.compare_solutions_detailed(auction_dir)
+    except TimeoutError:
         print("✗ Analysis timed out after 5 minutes")
-        return False
-    except Exception as e:
-        print(f"✗ Error running analysis: {e}")
-        return False
+        return None
+    except Exception:
+        print(f"✗ Error running analysis script:")
+        print(errors.getvalue() + traceback.format_exc())
+        return None
+    
+    # Count generated files
+    entries = _scan_dir(auction_dir)
+    analysis_count = sum(1 for name in entries if name.endswith("_analysis.json"))
+    print(f"✓ Generated {analysis_count} analysis files")
+    return entries
 
 def run_verification(auction_dir):
     """Run solution verification checks."""
@@ -202,37 +302,81 @@ def run_verification(auction_dir):
     
     print("Checking solution accuracy via on-chain verification...\n")
     
+    errors = io.StringIO()
+    try:
+        with _time_limit(STEP_TIMEOUT), redirect_stderr(errors):
+            check_verification.check_verifications(auction_dir)
+    except TimeoutError:
+        print("✗ Verification timed out after 5 minutes")
+        return False
+    except Exception:
+        print(f"\n\n✗ Verification had issues:")
+        print(errors.getvalue() + traceback.format_exc())
+        return False
+    
+    print()
+    return True
+
+def _summarize_analysis_file(analysis_file):
+    """Extract the summary statistics of one analysis file.
+    
+    Returns (summary, error); summary holds this auction's share of the
+    report, already resolved against its verification file.
+    """
     try:
-        script_dir = Path(__file__).parent
-        result = subprocess.run(
-            ['python3', str(script_dir / 'check_verification.py')],
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
+        data = _load_json(analysis_file)
         
-        # Print the output
-        print(result.stdout)
+        auction_id = data['auction_id']
         
-        if result.returncode != 0:
-            print(f"\n✗ Verification had issues:")
-            print(result.stderr)
-            return False
+        # Load verification file to get pool versions
+        verification_file = analysis_file.parent / f"{auction_id}_solution_verification.json"
+        pool_version_map = {}
+        try:
+            # A missing file just fails the open; no separate exists() check
+            for solution in _load_json(verification_file):
+                for swap in solution.get('swaps', []):
+                    pool_id = swap.get('pool_id')
+                    pool_version = swap.get('pool_version', 'Unknown')
+                    if pool_id:
+                        pool_version_map[pool_id] = pool_version
+        except:
+            pass
         
-        return True
+        # (address, kind, fee, version) per interaction
+        interactions = []
+        for interaction in data.get('interactions', []):
+            pool_id = interaction.get('pool_id', '')
+            interactions.append((
+                interaction.get('pool_address', ''),
+                interaction.get('pool_kind', ''),
+                interaction.get('pool_fee', ''),
+                pool_version_map.get(pool_id, 'Unknown'),
+            ))
         
-    except subprocess.TimeoutExpired:
-        print("✗ Verification timed out after 5 minutes")
-        return False
+        pool_stats = data.get('pool_stats') or {}
+        summary = {
+            'auction_id': auction_id,
+            'is_win': data.get('beat_winner', False),
+            'valid': data.get('valid'),
+            'competitive': data.get('competitive'),
+            'pool_type': next(iter(pool_stats), 'unknown'),
+            'pool_stats': pool_stats,
+            'interactions': interactions,
+            'surpluses': [trade.get('surplus_vs_min_pct', 0) for trade in data.get('trades', [])],
+        }
+        return summary, None
+    
     except Exception as e:
-        print(f"✗ Error running verification: {e}")
-        return False
+        return None, str(e)
 
-def generate_summary_report(auction_dir):
-    """Generate summary statistics from analysis files."""
+def generate_summary_report(auction_dir, entries):
+    """Generate summary statistics from analysis files.
+    
+    entries is the directory listing from _scan_dir.
+    """
     print_header("STEP 6: GENERATING SUMMARY REPORT")
     
-    analysis_files = list(auction_dir.glob("*_analysis.json"))
+    analysis_files = [auction_dir / name for name in entries if name.endswith("_analysis.json")]
     
     if not analysis_files:
         print("✗ No analysis files found")
@@ -246,104 +390,95 @@ def generate_summary_report(auction_dir):
         'total_surplus': 0,
         'pool_types': defaultdict(int),
         'pool_versions': defaultdict(int),
-        'pool_addresses': defaultdict(lambda: {'count': 0, 'wins': 0, 'type': '', 'version': '', 'fee': ''}),
+        'pool_addresses': {},
         'wins': [],
         'losses': []
     }
     
-    for analysis_file in analysis_files:
-        try:
-            with open(analysis_file) as f:
-                data = json.load(f)
-            
-            auction_id = data['auction_id']
-            is_win = data.get('beat_winner', False)
+    # Per pool address: a row indexed by the _COUNT.._FEE columns
+    pool_rows = {}
+    
+    # Parse the analysis files across all cores, merging in file order
+    with multiprocessing.Pool() as pool:
+        results = pool.imap(_summarize_analysis_file, analysis_files, chunksize=16)
+        
+        for analysis_file, (summary, error) in zip(analysis_files, results):
+            if error is not None:
+                print(f"  ✗ Error reading {analysis_file.name}: {error}")
+                continue
             
-            # Load verification file to get pool versions
-            verification_file = auction_dir / f"{auction_id}_solution_verification.json"
-            pool_version_map = {}
-            if verification_file.exists():
-                try:
-                    with open(verification_file) as vf:
-                        verif_data = json.load(vf)
-                        for solution in verif_data:
-                            for swap in solution.get('swaps', []):
-                                pool_id = swap.get('pool_id')
-                                pool_version = swap.get('pool_version', 'Unknown')
-                                if pool_id:
-                                    pool_version_map[pool_id] = pool_version
-                except:
-                    pass
+            is_win = summary['is_win']
             
-            if data.get('valid'):
+            if summary['valid']:
                 stats['valid_solutions'] += 1
             
-            if data.get('competitive'):
+            if summary['competitive']:
                 stats['competitive'] += 1
             
             if is_win:
                 stats['beat_winner'] += 1
                 stats['wins'].append({
-                    'auction_id': auction_id,
-                    'pool_type': list(data['pool_stats'].keys())[0] if data['pool_stats'] else 'unknown'
+                    'auction_id': summary['auction_id'],
+                    'pool_type': summary['pool_type']
                 })
             else:
                 stats['losses'].append({
-                    'auction_id': auction_id,
-                    'pool_type': list(data['pool_stats'].keys())[0] if data['pool_stats'] else 'unknown'
+                    'auction_id': summary['auction_id'],
+                    'pool_type': summary['pool_type']
                 })
             
             # Pool statistics
-            for pool_type, count in data.get('pool_stats', {}).items():
+            for pool_type, count in summary['pool_stats'].items():
                 stats['pool_types'][pool_type] += count
             
-            # Extract pool information from interactions
-            for interaction in data.get('interactions', []):
-                pool_id = interaction.get('pool_id', '')
-                pool_address = interaction.get('pool_address', '')
-                pool_kind = interaction.get('pool_kind', '')
-                pool_fee = interaction.get('pool_fee', '')
-                pool_version = pool_version_map.get(pool_id, 'Unknown')
-                
+            # Pool information from interactions
+            for pool_address, pool_kind, pool_fee, pool_version in summary['interactions']:
                 if pool_address:
-                    stats['pool_addresses'][pool_address]['count'] += 1
+                    row = pool_rows.get(pool_address)
+                    if row is None:
+                        row = pool_rows[pool_address] = [0, 0, '', '', '']
+                    row[_COUNT] += 1
                     if is_win:
-                        stats['pool_addresses'][pool_address]['wins'] += 1
-                    stats['pool_addresses'][pool_address]['type'] = pool_kind
-                    stats['pool_addresses'][pool_address]['version'] = pool_version
-                    stats['pool_addresses'][pool_address]['fee'] = pool_fee
+                        row[_WINS] += 1
+                    row[_TYPE] = pool_kind
+                    row[_VERSION] = pool_version
+                    row[_FEE] = pool_fee
                 
                 # Track pool versions
                 if pool_version != 'Unknown':
                     stats['pool_versions'][pool_version] += 1
             
             # Calculate surplus
-            for trade in data.get('trades', []):
-                stats['total_surplus'] += trade.get('surplus_vs_min_pct', 0)
-        
-        except Exception as e:
-            print(f"  ✗ Error reading {analysis_file.name}: {e}")
+            for surplus in summary['surpluses']:
+                stats['total_surplus'] += surplus
+    
+    for pool_address, row in pool_rows.items():
+        stats['pool_addresses'][pool_address] = {
+            'count': row[_COUNT], 'wins': row[_WINS], 'type': row[_TYPE],
+            'version': row[_VERSION], 'fee': row[_FEE]
+        }
     
     # Calculate averages
-    avg_surplus = stats['total_surplus'] / max(stats['total_auctions'], 1)
+    denom = max(stats['total_auctions'], 1)
+    avg_surplus = stats['total_surplus'] / denom
     
     # Print summary
     print_section("PERFORMANCE SUMMARY")
     print(f"Total Auctions Analyzed:     {stats['total_auctions']:>6}")
-    print(f"Valid Solutions:             {stats['valid_solutions']:>6} ({stats['valid_solutions']/max(stats['total_auctions'],1)*100:.1f}%)")
-    print(f"Beat Winner:                 {stats['beat_winner']:>6} ({stats['beat_winner']/max(stats['total_auctions'],1)*100:.1f}%)")
+    print(f"Valid Solutions:             {stats['valid_solutions']:>6} ({stats['valid_solutions']/denom*100:.1f}%)")
+    print(f"Beat Winner:                 {stats['beat_winner']:>6} ({stats['beat_winner']/denom*100:.1f}%)")
     print(f"Average Surplus:             {avg_surplus:>6.2f}%")
     
     print_section("POOL VERSIONS")
-    total_versions = sum(stats['pool_versions'].values())
+    total_versions = max(sum(stats['pool_versions'].values()), 1)
     for version, count in sorted(stats['pool_versions'].items(), key=lambda x: -x[1]):
-        pct = count / max(total_versions, 1) * 100
+        pct = count / total_versions * 100
         print(f"  {version:<20} {count:>4} ({pct:>5.1f}%)")
     
     print_section("POOL TYPES")
-    total_pool_usages = sum(stats['pool_types'].values())
+    total_pool_usages = max(sum(stats['pool_types'].values()), 1)
     for pool_type, count in sorted(stats['pool_types'].items(), key=lambda x: -x[1]):
-        pct = count / max(total_pool_usages, 1) * 100
+        pct = count / total_pool_usages * 100
         print(f"  {pool_type:<20} {count:>4} ({pct:>5.1f}%)")
     
     print_section("SPECIFIC POOLS USED")
@@ -375,51 +510,57 @@ def save_report(stats, output_dir):
     
     # Save stats
     report_file = report_dir / "summary_report.json"
-    with open(report_file, 'w') as f:
-        json.dump(stats, f, indent=2, default=str)
+    if orjson is not None:
+        report_file.write_bytes(orjson.dumps(stats, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(stats, f, indent=2, default=str)
     
     print(f"✓ Report saved to: {report_file}")
     
-    # Create markdown report
+    # Create markdown report, built in full and written in one go
+    denom = max(stats['total_auctions'], 1)
+    out = []
+    out.append(f"# Solution Analysis Report\n\n")
+    out.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    out.append(f"## Summary\n\n")
+    out.append(f"- Total Auctions: {stats['total_auctions']}\n")
+    out.append(f"- Valid Solutions: {stats['valid_solutions']} ({stats['valid_solutions']/denom*100:.1f}%)\n")
+    out.append(f"- Win Rate: {stats['beat_winner']} / {stats['total_auctions']} ({stats['beat_winner']/denom*100:.1f}%)\n")
+    out.append(f"- Average Surplus: {stats['total_surplus']/denom:.2f}%\n\n")
+    
+    out.append(f"## Pool Versions\n\n")
+    total_versions = max(sum(stats['pool_versions'].values()), 1)
+    for version, count in sorted(stats['pool_versions'].items(), key=lambda x: -x[1]):
+        pct = count / total_versions * 100
+        out.append(f"- {version}: {count} ({pct:.1f}%)\n")
+    
+    out.append(f"\n## Pool Types\n\n")
+    total_pool_usages = max(sum(stats['pool_types'].values()), 1)
+    for pool_type, count in sorted(stats['pool_types'].items(), key=lambda x: -x[1]):
+        pct = count / total_pool_usages * 100
+        out.append(f"- {pool_type}: {count} ({pct:.1f}%)\n")
+    
+    out.append(f"\n## Specific Pools Used\n\n")
+    for pool_address, info in sorted(stats['pool_addresses'].items(), key=lambda x: -x[1]['count']):
+        win_rate = (info['wins'] / info['count'] * 100) if info['count'] > 0 else 0
+        out.append(f"### Pool: `{pool_address}`\n\n")
+        out.append(f"- **Version**: {info['version']}\n")
+        out.append(f"- **Type**: {info['type']}\n")
+        out.append(f"- **Fee**: {info['fee']}\n")
+        out.append(f"- **Total Uses**: {info['count']}\n")
+        out.append(f"- **Wins**: {info['wins']} ({win_rate:.1f}% win rate)\n\n")
+    
+    out.append(f"\n## Wins ({len(stats['wins'])})\n\n")
+    for win in stats['wins']:
+        out.append(f"- Auction {win['auction_id']} ({win['pool_type']})\n")
+    
+    out.append(f"\n## Losses ({len(stats['losses'])})\n\n")
+    for loss in stats['losses']:
+        out.append(f"- Auction {loss['auction_id']} ({loss['pool_type']})\n")
+    
     md_file = report_dir / "ANALYSIS_REPORT.md"
-    with open(md_file, 'w') as f:
-        f.write(f"# Solution Analysis Report\n\n")
-        f.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"## Summary\n\n")
-        f.write(f"- Total Auctions: {stats['total_auctions']}\n")
-        f.write(f"- Valid Solutions: {stats['valid_solutions']} ({stats['valid_solutions']/max(stats['total_auctions'],1)*100:.1f}%)\n")
-        f.write(f"- Win Rate: {stats['beat_winner']} / {stats['total_auctions']} ({stats['beat_winner']/max(stats['total_auctions'],1)*100:.1f}%)\n")
-        f.write(f"- Average Surplus: {stats['total_surplus']/max(stats['total_auctions'],1):.2f}%\n\n")
-        
-        f.write(f"## Pool Versions\n\n")
-        total_versions = sum(stats['pool_versions'].values())
-        for version, count in sorted(stats['pool_versions'].items(), key=lambda x: -x[1]):
-            pct = count / max(total_versions, 1) * 100
-            f.write(f"- {version}: {count} ({pct:.1f}%)\n")
-        
-        f.write(f"\n## Pool Types\n\n")
-        total_pool_usages = sum(stats['pool_types'].values())
-        for pool_type, count in sorted(stats['pool_types'].items(), key=lambda x: -x[1]):
-            pct = count / max(total_pool_usages, 1) * 100
-            f.write(f"- {pool_type}: {count} ({pct:.1f}%)\n")
-        
-        f.write(f"\n## Specific Pools Used\n\n")
-        for pool_address, info in sorted(stats['pool_addresses'].items(), key=lambda x: -x[1]['count']):
-            win_rate = (info['wins'] / info['count'] * 100) if info['count'] > 0 else 0
-            f.write(f"### Pool: `{pool_address}`\n\n")
-            f.write(f"- **Version**: {info['version']}\n")
-            f.write(f"- **Type**: {info['type']}\n")
-            f.write(f"- **Fee**: {info['fee']}\n")
-            f.write(f"- **Total Uses**: {info['count']}\n")
-            f.write(f"- **Wins**: {info['wins']} ({win_rate:.1f}% win rate)\n\n")
-        
-        f.write(f"\n## Wins ({len(stats['wins'])})\n\n")
-        for win in stats['wins']:
-            f.write(f"- Auction {win['auction_id']} ({win['pool_type']})\n")
-        
-        f.write(f"\n## Losses ({len(stats['losses'])})\n\n")
-        for loss in stats['losses']:
-            f.write(f"- Auction {loss['auction_id']} ({loss['pool_type']})\n")
+    md_file.write_text("".join(out), encoding="utf-8")
     
     print(f"✓ Markdown report saved to: {md_file}")
     
@@ -440,11 +581,14 @@ def main():
         print("Please make sure auction data exists or set AUCTION_DIR env var")
         return 1
     
+    # One listing serves steps 1-3; cleanup only removes auctions step 3 skips
+    entries = _scan_dir(auction_dir)
+    
     # Step 1: Scan for solutions
-    solution_stats = check_solutions(auction_dir)
+    solution_stats = check_solutions(auction_dir, entries)
     
     # Step 2: Clean up empty auction files (always run, even if no solutions)
-    cleanup_empty_auctions(auction_dir, solution_stats['empty_auction_ids'])
+    cleanup_empty_auctions(auction_dir, solution_stats['empty_auction_ids'], entries)
     
     if solution_stats['with_solutions'] == 0:
         print("\n✗ No solutions found in auction data!")
@@ -452,7 +596,7 @@ def main():
         return 0  # Exit successfully after cleanup
     
     # Step 3: Check required files
-    valid_auctions = check_required_files(auction_dir, solution_stats['auction_ids'])
+    valid_auctions = check_required_files(auction_dir, solution_stats['auction_ids'], entries)
     
     if not valid_auctions:
         print("\n✗ No auctions have all required files!")
@@ -462,7 +606,8 @@ def main():
     print(f"\n✓ Found {len(valid_auctions)} auctions ready for analysis")
     
     # Step 4: Generate analysis
-    if not generate_analysis(auction_dir, valid_auctions):
+    entries = generate_analysis(auction_dir, valid_auctions)
+    if entries is None:
         print("\n✗ Failed to generate analysis")
         return 1
     
@@ -471,7 +616,7 @@ def main():
     run_verification(auction_dir)
     
     # Step 6: Generate summary
-    stats = generate_summary_report(auction_dir)
+    stats = generate_summary_report(auction_dir, entries)
     
     if not stats:
         print("\n✗ Failed to generate summary report")
@@ -503,7 +648,6 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n\n✗ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -4,135 +4,248 @@ Interactive viewer for solution analysis files.
 Displays analysis in a nice, readable format with multiple viewing modes.
 """
 
+import functools
 import json
 import os
+import pickle
 import sys
+from operator import itemgetter
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+try:
+    import orjson  # optional: faster parsing of analysis files
+except ImportError:
+    orjson = None
+
+# Below this many files a worker pool costs more to start than it saves
+MIN_FILES_FOR_POOL = 8
+
+# Parsed analyses from earlier runs, keyed by analysis file path and reused
+# while the file is unchanged, so switching views does not re-parse them
+CACHE_FILE = Path.home() / ".cache" / "view_analysis.pickle"
+# Bumped whenever the cached analysis format (_slim) changes
+CACHE_VERSION = 1
+
+# Fields of an analysis, and of each of its interactions, that the
+# multi-file views (summary, list, pools) read
+VIEW_FIELDS = ('auction_id', 'valid', 'competitive', 'beat_winner', 'pool_stats', 'trades', 'interactions')
+INTERACTION_FIELDS = ('pool_address', 'pool_kind', 'pool_fee')
+
+def _load_json(path):
+    """Parse one analysis file."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def _slim(data):
+    """Project a parsed analysis onto VIEW_FIELDS; missing fields stay missing."""
+    slim = {key: data[key] for key in VIEW_FIELDS if key in data}
+    if 'interactions' in slim:
+        slim['interactions'] = [
+            {key: interaction[key] for key in INTERACTION_FIELDS if key in interaction}
+            for interaction in slim['interactions']
+        ]
+    return slim
+
+def _load_slim(path):
+    """Parse one analysis file and keep only what the multi-file views use."""
+    return _slim(_load_json(path))
+
+def _list_analyses(auction_dir):
+    """Paths (as strings) of the analysis files in auction_dir, in directory order."""
+    with os.scandir(auction_dir) as it:
+        return [e.path for e in it if e.name.endswith("_analysis.json") and e.is_file()]
+
+def _file_signature(path):
+    """(mtime_ns, size) of a file."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=None)
+def _load_cache():
+    """Load the parsed analyses cache, or an empty one.
+    
+    Loaded once per run: later _load_all calls update the same dict, and
+    its per-file signatures still catch files changed in between.
+    """
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            version, cache = pickle.load(f)
+    except Exception:
+        return {}
+    return cache if version == CACHE_VERSION and isinstance(cache, dict) else {}
+
+def _save_cache(cache):
+    """Write the parsed analyses cache; failures only cost the next run time."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((CACHE_VERSION, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: could not write cache {CACHE_FILE}: {e}")
+
+def _load_all(files):
+    """Parse analysis files into _slim projections, keeping their order.
+    
+    Unchanged files come from the cache; the rest are parsed, across all
+    cores when there are enough of them. Cached files of the same
+    directories that are no longer listed are dropped.
+    """
+    cache = _load_cache()
+    signatures = [_file_signature(file) for file in files]
+    stale = [i for i, (file, signature) in enumerate(zip(files, signatures))
+             if cache.get(file, (None,))[0] != signature]
+    
+    listed = set(files)
+    directories = {os.path.dirname(file) for file in files}
+    removed = [key for key in cache
+               if key not in listed and os.path.dirname(key) in directories]
+    for key in removed:
+        del cache[key]
+    
+    if stale:
+        stale_files = [files[i] for i in stale]
+        if len(stale_files) < MIN_FILES_FOR_POOL:
+            parsed = [_load_slim(file) for file in stale_files]
+        else:
+            # Imported here: help, auction <id> and fully cached runs never need it
+            import multiprocessing
+            with multiprocessing.Pool() as pool:
+                parsed = pool.map(_load_slim, stale_files, chunksize=16)
+        for i, data in zip(stale, parsed):
+            cache[files[i]] = (signatures[i], data)
+    
+    if stale or removed:
+        _save_cache(cache)
+    
+    return [cache[file][1] for file in files]
+
+# Decimals of common tokens, by display name; anything else is taken as 18
+_TOKEN_DECIMALS = {
+    'USDC': 6,
+    'USDT': 6,
+    'WBTC': 8,
+    'WETH': 18,
+    'ETH': 18,
+    'DAI': 18,
+    'AAVE': 18,
+    'UNI': 18,
+}
+
+# decimals -> (divisor, format spec); 18 decimals (WETH, DAI) is the default
+_NUMBER_FORMATS = {
+    6: (1e6, ',.2f'),   # USDC
+    8: (1e8, ',.6f'),   # WBTC
+}
+_DEFAULT_NUMBER_FORMAT = (1e18, ',.6f')
 
 def format_number(num_str, decimals=18):
     """Format large numbers nicely."""
     try:
-        num = int(num_str)
-        if decimals == 6:  # USDC
-            return f"{num / 1e6:,.2f}"
-        elif decimals == 8:  # WBTC
-            return f"{num / 1e8:,.6f}"
-        else:  # 18 decimals (WETH, DAI)
-            return f"{num / 1e18:,.6f}"
+        divisor, spec = _NUMBER_FORMATS.get(decimals, _DEFAULT_NUMBER_FORMAT)
+        return format(int(num_str) / divisor, spec)
     except:
         return str(num_str)
 
-def get_token_decimals(token_name):
-    """Get decimals for common tokens."""
-    decimals_map = {
-        'USDC': 6,
-        'USDT': 6,
-        'WBTC': 8,
-        'WETH': 18,
-        'ETH': 18,
-        'DAI': 18,
-        'AAVE': 18,
-        'UNI': 18,
-    }
-    return decimals_map.get(token_name, 18)
+# Rules for the table and section widths used below, built once
+_EQ = {w: "=" * w for w in (60, 70, 90, 100, 120)}
+_DA = {w: "-" * w for w in (60, 70, 90, 100, 120)}
 
-def print_header(title, width=100):
-    """Print a nice header."""
-    print("\n" + "=" * width)
-    print(f"{title:^{width}}")
-    print("=" * width)
+def render_header(title, width=100):
+    """Render a nice header."""
+    rule = _EQ.get(width) or "=" * width
+    return f"\n{rule}\n{title:^{width}}\n{rule}"
 
-def print_section(title, width=100):
-    """Print a section divider."""
-    print(f"\n{title}")
-    print("-" * width)
+def render_section(title, width=100):
+    """Render a section divider."""
+    return f"\n{title}\n{_DA.get(width) or '-' * width}"
 
-def view_summary(analysis_files):
-    """Display summary of all analyses."""
-    print_header("SOLUTION ANALYSIS SUMMARY")
+def view_summary(analysis_files, out):
+    """Render summary of all analyses into the out list."""
+    out.append(render_header("SOLUTION ANALYSIS SUMMARY"))
     
     # Load all files
-    results = []
-    for file in sorted(analysis_files):
-        with open(file) as f:
-            results.append(json.load(f))
+    results = _load_all(analysis_files)
     
-    # Calculate statistics
+    # Calculate statistics, pool usage, total surplus and the win/loss split in one pass
     total = len(results)
-    valid = sum(1 for r in results if r['valid'])
-    competitive = sum(1 for r in results if r['competitive'])
-    beat_winner = sum(1 for r in results if r['beat_winner'])
-    
-    # Pool statistics
-    pool_types = defaultdict(int)
+    valid = competitive = beat_winner = 0
+    pool_types = Counter()
+    total_surplus = 0
+    wins = []
+    losses = []
+    summary_fields = itemgetter('valid', 'competitive', 'beat_winner', 'pool_stats', 'trades')
     for r in results:
-        for pool_type, count in r['pool_stats'].items():
-            pool_types[pool_type] += count
-    
-    # Performance statistics
-    total_surplus = sum(
-        t['surplus_vs_min_pct'] 
-        for r in results 
-        for t in r['trades']
-    )
+        r_valid, r_competitive, r_beat_winner, r_pool_stats, r_trades = summary_fields(r)
+        if r_valid:
+            valid += 1
+        if r_competitive:
+            competitive += 1
+        if r_beat_winner:
+            beat_winner += 1
+            wins.append(r)
+        else:
+            losses.append(r)
+        pool_types.update(r_pool_stats)
+        for t in r_trades:
+            total_surplus += t['surplus_vs_min_pct']
     avg_surplus = total_surplus / total if total > 0 else 0
     
     # Display
-    print(f"\n{'Metric':<40} {'Value':>15} {'Percentage':>15}")
-    print("-" * 70)
-    print(f"{'Total Auctions':<40} {total:>15}")
+    out.append(f"\n{'Metric':<40} {'Value':>15} {'Percentage':>15}")
+    out.append(_DA[70])
+    out.append(f"{'Total Auctions':<40} {total:>15}")
     valid_pct = f'({valid/total*100:.1f}%)'
-    print(f"{'Valid Solutions':<40} {valid:>15} {valid_pct:>15}")
+    out.append(f"{'Valid Solutions':<40} {valid:>15} {valid_pct:>15}")
     comp_pct = f'({competitive/total*100:.1f}%)'
-    print(f"{'Competitive (Beat Winner)':<40} {competitive:>15} {comp_pct:>15}")
+    out.append(f"{'Competitive (Beat Winner)':<40} {competitive:>15} {comp_pct:>15}")
     beat_pct = f'({beat_winner/total*100:.1f}%)'
-    print(f"{'Beat Winner Output':<40} {beat_winner:>15} {beat_pct:>15}")
+    out.append(f"{'Beat Winner Output':<40} {beat_winner:>15} {beat_pct:>15}")
     avg_str = f'{avg_surplus:.2f}%'
-    print(f"{'Average Surplus vs User Min':<40} {avg_str:>15}")
+    out.append(f"{'Average Surplus vs User Min':<40} {avg_str:>15}")
     
-    print_section("Pool Usage Statistics")
-    print(f"{'Pool Type':<30} {'Count':>15} {'Percentage':>15}")
-    print("-" * 60)
+    out.append(render_section("Pool Usage Statistics"))
+    out.append(f"{'Pool Type':<30} {'Count':>15} {'Percentage':>15}")
+    out.append(_DA[60])
     total_pools = sum(pool_types.values())
-    for pool_type, count in sorted(pool_types.items(), key=lambda x: -x[1]):
+    for pool_type, count in pool_types.most_common():
         pool_pct = f'({count/total_pools*100:.1f}%)'
-        print(f"{pool_type:<30} {count:>15} {pool_pct:>15}")
+        out.append(f"{pool_type:<30} {count:>15} {pool_pct:>15}")
     
     # Win/Loss breakdown
-    print_section("Performance Breakdown")
-    wins = [r for r in results if r['beat_winner']]
-    losses = [r for r in results if not r['beat_winner']]
+    out.append(render_section("Performance Breakdown"))
     
     if wins:
-        print(f"\n✓ WE BEAT THE WINNER ({len(wins)} auctions):")
+        out.append(f"\n✓ WE BEAT THE WINNER ({len(wins)} auctions):")
         for r in wins:
             trade = r['trades'][0]
-            print(f"  • Auction {r['auction_id']}: "
-                  f"{trade['sell_token_name']}→{trade['buy_token_name']} "
-                  f"(+{trade['diff_vs_winner_pct']:.2f}% better)")
+            out.append(f"  • Auction {r['auction_id']}: "
+                       f"{trade['sell_token_name']}→{trade['buy_token_name']} "
+                       f"(+{trade['diff_vs_winner_pct']:.2f}% better)")
     
     if losses:
-        print(f"\n✗ WINNER BEAT US ({len(losses)} auctions):")
+        out.append(f"\n✗ WINNER BEAT US ({len(losses)} auctions):")
         for r in losses:
             trade = r['trades'][0]
-            print(f"  • Auction {r['auction_id']}: "
-                  f"{trade['sell_token_name']}→{trade['buy_token_name']} "
-                  f"({trade['diff_vs_winner_pct']:.2f}% behind)")
+            out.append(f"  • Auction {r['auction_id']}: "
+                       f"{trade['sell_token_name']}→{trade['buy_token_name']} "
+                       f"({trade['diff_vs_winner_pct']:.2f}% behind)")
 
-def view_detailed_list(analysis_files):
-    """Display detailed list of all analyses."""
-    print_header("DETAILED ANALYSIS LIST")
+def view_detailed_list(analysis_files, out):
+    """Render detailed list of all analyses into the out list."""
+    out.append(render_header("DETAILED ANALYSIS LIST"))
     
     # Table header
-    print(f"\n{'Auction':<12} {'Valid':>7} {'Win':>7} {'Surplus':>10} "
-          f"{'Pool':>18} {'Trade':>20} {'Rank':>8}")
-    print("-" * 90)
+    out.append(f"\n{'Auction':<12} {'Valid':>7} {'Win':>7} {'Surplus':>10} "
+               f"{'Pool':>18} {'Trade':>20} {'Rank':>8}")
+    out.append(_DA[90])
     
-    for file in sorted(analysis_files):
-        with open(file) as f:
-            data = json.load(f)
-        
+    for data in _load_all(analysis_files):
         valid_icon = "✓" if data['valid'] else "✗"
         win_icon = "🏆" if data['beat_winner'] else "✗"
         
@@ -142,16 +255,15 @@ def view_detailed_list(analysis_files):
         trade_pair = f"{trade.get('sell_token_name', '?')}→{trade.get('buy_token_name', '?')}"
         rank = f"Rank {trade.get('winner_ranking', '?')}"
         
-        print(f"{data['auction_id']:<12} {valid_icon:>7} {win_icon:>7} {surplus:>10} "
-              f"{pool_type:>18} {trade_pair:>20} {rank:>8}")
+        out.append(f"{data['auction_id']:<12} {valid_icon:>7} {win_icon:>7} {surplus:>10} "
+                   f"{pool_type:>18} {trade_pair:>20} {rank:>8}")
 
-def view_individual(analysis_file):
-    """Display detailed view of a single analysis."""
-    with open(analysis_file) as f:
-        data = json.load(f)
+def view_individual(analysis_file, out):
+    """Render detailed view of a single analysis into the out list."""
+    data = _load_json(analysis_file)
     
     auction_id = data['auction_id']
-    print_header(f"AUCTION {auction_id} - DETAILED ANALYSIS")
+    out.append(render_header(f"AUCTION {auction_id} - DETAILED ANALYSIS"))
     
     # Status badges
     status = []
@@ -166,94 +278,94 @@ def view_individual(analysis_file):
     if data['beat_winner']:
         status.append("👑 BEAT WINNER")
     
-    print(f"\nStatus: {' | '.join(status)}")
-    print(f"Solution ID: {data['solution_id']}")
-    print(f"Gas Estimate: {data['gas']:,}")
-    print(f"Interactions: {data['num_interactions']}")
-    print(f"Trades: {data['num_trades']}")
+    out.append(f"\nStatus: {' | '.join(status)}")
+    out.append(f"Solution ID: {data['solution_id']}")
+    out.append(f"Gas Estimate: {data['gas']:,}")
+    out.append(f"Interactions: {data['num_interactions']}")
+    out.append(f"Trades: {data['num_trades']}")
     
     # Pool interactions
-    print_section("POOL INTERACTIONS", 100)
+    out.append(render_section("POOL INTERACTIONS", 100))
     for i, interaction in enumerate(data['interactions'], 1):
-        print(f"\nInteraction {i}:")
-        print(f"  Pool ID: {interaction['pool_id']}")
-        print(f"  Type: {interaction['pool_kind']}")
-        print(f"  Address: {interaction['pool_address']}")
-        print(f"  Fee: {interaction['pool_fee']}")
+        out.append(f"\nInteraction {i}:")
+        out.append(f"  Pool ID: {interaction['pool_id']}")
+        out.append(f"  Type: {interaction['pool_kind']}")
+        out.append(f"  Address: {interaction['pool_address']}")
+        out.append(f"  Fee: {interaction['pool_fee']}")
         
-        in_decimals = get_token_decimals(interaction['input_token_name'])
-        out_decimals = get_token_decimals(interaction['output_token_name'])
+        in_decimals = _TOKEN_DECIMALS.get(interaction['input_token_name'], 18)
+        out_decimals = _TOKEN_DECIMALS.get(interaction['output_token_name'], 18)
         
         in_amount = format_number(interaction['input_amount'], in_decimals)
         out_amount = format_number(interaction['output_amount'], out_decimals)
         
-        print(f"\n  Route:")
-        print(f"    {interaction['input_token_name']:>8} ({in_amount:>15})")
-        print(f"         ↓")
-        print(f"    {interaction['output_token_name']:>8} ({out_amount:>15})")
+        out.append(f"\n  Route:")
+        out.append(f"    {interaction['input_token_name']:>8} ({in_amount:>15})")
+        out.append(f"         ↓")
+        out.append(f"    {interaction['output_token_name']:>8} ({out_amount:>15})")
     
     # Trade results
-    print_section("TRADE RESULTS", 100)
+    out.append(render_section("TRADE RESULTS", 100))
     for i, trade in enumerate(data['trades'], 1):
-        print(f"\nTrade {i}:")
-        print(f"  Order ID: {trade['order_id'][:50]}...")
-        print(f"  Trade Pair: {trade['sell_token_name']} → {trade['buy_token_name']}")
+        out.append(f"\nTrade {i}:")
+        out.append(f"  Order ID: {trade['order_id'][:50]}...")
+        out.append(f"  Trade Pair: {trade['sell_token_name']} → {trade['buy_token_name']}")
         
-        sell_decimals = get_token_decimals(trade['sell_token_name'])
-        buy_decimals = get_token_decimals(trade['buy_token_name'])
+        sell_decimals = _TOKEN_DECIMALS.get(trade['sell_token_name'], 18)
+        buy_decimals = _TOKEN_DECIMALS.get(trade['buy_token_name'], 18)
         
         sell_amount = format_number(trade['sell_amount'], sell_decimals)
-        print(f"\n  Sell: {sell_amount} {trade['sell_token_name']}")
+        out.append(f"\n  Sell: {sell_amount} {trade['sell_token_name']}")
         
         required = format_number(trade['buy_amount_required'], buy_decimals)
         our_output = format_number(trade['our_output'], buy_decimals)
         
-        print(f"\n  {'Requirement':<25} {'Amount':>20} {'Status':>15}")
-        print(f"  {'-'*60}")
-        print(f"  {'User Minimum':<25} {required:>20} {trade['buy_token_name']:>15}")
-        print(f"  {'Our Output':<25} {our_output:>20} {trade['buy_token_name']:>15}")
+        out.append(f"\n  {'Requirement':<25} {'Amount':>20} {'Status':>15}")
+        out.append(f"  {_DA[60]}")
+        out.append(f"  {'User Minimum':<25} {required:>20} {trade['buy_token_name']:>15}")
+        out.append(f"  {'Our Output':<25} {our_output:>20} {trade['buy_token_name']:>15}")
         
         surplus = format_number(trade['surplus_vs_min'], buy_decimals)
         surplus_pct = trade['surplus_vs_min_pct']
         
         if trade['valid']:
             pct_display = f'(+{surplus_pct:.2f}%)'
-            print(f"  {'Surplus':<25} {surplus:>20} {pct_display:>15} ✓")
+            out.append(f"  {'Surplus':<25} {surplus:>20} {pct_display:>15} ✓")
         else:
             pct_display = f'({surplus_pct:.2f}%)'
-            print(f"  {'Deficit':<25} {surplus:>20} {pct_display:>15} ✗")
+            out.append(f"  {'Deficit':<25} {surplus:>20} {pct_display:>15} ✗")
         
         # Winner comparison
         if 'winner_output' in trade and trade['winner_output'] != '0':
-            print(f"\n  {'Comparison vs Winner':<25}")
-            print(f"  {'-'*60}")
+            out.append(f"\n  {'Comparison vs Winner':<25}")
+            out.append(f"  {_DA[60]}")
             
             winner_output = format_number(trade['winner_output'], buy_decimals)
             diff = format_number(trade['diff_vs_winner'], buy_decimals)
             diff_pct = trade['diff_vs_winner_pct']
             
-            print(f"  {'Winner Output':<25} {winner_output:>20} {trade['buy_token_name']:>15}")
+            out.append(f"  {'Winner Output':<25} {winner_output:>20} {trade['buy_token_name']:>15}")
             winner_rank = f"Rank {trade['winner_ranking']}"
-            print(f"  {'Winner Ranking':<25} {winner_rank:>20}")
+            out.append(f"  {'Winner Ranking':<25} {winner_rank:>20}")
             
             if trade['beat_winner']:
                 pct_str = f'(+{diff_pct:.2f}%)'
-                print(f"  {'Our Advantage':<25} {diff:>20} {pct_str:>15} 🏆")
+                out.append(f"  {'Our Advantage':<25} {diff:>20} {pct_str:>15} 🏆")
             else:
                 pct_str = f'({diff_pct:.2f}%)'
-                print(f"  {'Their Advantage':<25} {diff:>20} {pct_str:>15}")
+                out.append(f"  {'Their Advantage':<25} {diff:>20} {pct_str:>15}")
         
         # Execution details
-        print(f"\n  {'Execution Details':<25}")
-        print(f"  {'-'*60}")
+        out.append(f"\n  {'Execution Details':<25}")
+        out.append(f"  {_DA[60]}")
         exec_amount = format_number(trade['executed_amount'], sell_decimals)
         fee_amount = format_number(trade['fee'], sell_decimals)
-        print(f"  {'Executed Amount':<25} {exec_amount:>20} {trade['sell_token_name']:>15}")
-        print(f"  {'Fee':<25} {fee_amount:>20} {trade['sell_token_name']:>15}")
+        out.append(f"  {'Executed Amount':<25} {exec_amount:>20} {trade['sell_token_name']:>15}")
+        out.append(f"  {'Fee':<25} {fee_amount:>20} {trade['sell_token_name']:>15}")
     
     # Clearing prices
     if data['prices']:
-        print_section("CLEARING PRICES", 100)
+        out.append(render_section("CLEARING PRICES", 100))
         for token, price in data['prices'].items():
             # Determine token name from address
             token_name = "Unknown"
@@ -263,114 +375,127 @@ def view_individual(analysis_file):
                 elif t['buy_token'] == token:
                     token_name = t['buy_token_name']
             
-            print(f"  {token_name:>8}: {price}")
+            out.append(f"  {token_name:>8}: {price}")
 
-def view_pools(analysis_files):
-    """Display pool usage analysis."""
-    print_header("POOL USAGE ANALYSIS")
+def view_pools(analysis_files, out):
+    """Render pool usage analysis into the out list."""
+    out.append(render_header("POOL USAGE ANALYSIS"))
     
-    # Aggregate pool data
-    pool_data = {}
+    # Aggregate pool data, one dict per field, keyed by pool address in
+    # order of first use
+    uses = defaultdict(int)
+    wins = defaultdict(int)
+    total_surplus = defaultdict(int)
+    auctions = defaultdict(list)
+    kinds = {}
+    fees = {}
     
-    for file in analysis_files:
-        with open(file) as f:
-            data = json.load(f)
+    for data in _load_all(analysis_files):
+        auction_id = data['auction_id']
+        is_win = data['beat_winner']
+        trades = data['trades']
         
         for interaction in data['interactions']:
             pool_addr = interaction['pool_address']
             
-            if pool_addr not in pool_data:
-                pool_data[pool_addr] = {
-                    'address': pool_addr,
-                    'kind': interaction['pool_kind'],
-                    'fee': interaction['pool_fee'],
-                    'uses': 0,
-                    'wins': 0,
-                    'total_surplus': 0,
-                    'auctions': []
-                }
+            if pool_addr not in kinds:
+                kinds[pool_addr] = interaction['pool_kind']
+                fees[pool_addr] = interaction['pool_fee']
             
-            pool_data[pool_addr]['uses'] += 1
-            pool_data[pool_addr]['auctions'].append(data['auction_id'])
+            uses[pool_addr] += 1
+            auctions[pool_addr].append(auction_id)
             
-            if data['beat_winner']:
-                pool_data[pool_addr]['wins'] += 1
+            if is_win:
+                wins[pool_addr] += 1
             
-            if data['trades']:
-                pool_data[pool_addr]['total_surplus'] += data['trades'][0]['surplus_vs_min_pct']
+            if trades:
+                total_surplus[pool_addr] += trades[0]['surplus_vs_min_pct']
     
     # Display pool statistics
-    print(f"\n{'Pool Address':<44} {'Type':>18} {'Fee':>8} {'Uses':>6} {'Wins':>6} {'Win%':>8} {'Avg Surplus':>12}")
-    print("-" * 120)
+    out.append(f"\n{'Pool Address':<44} {'Type':>18} {'Fee':>8} {'Uses':>6} {'Wins':>6} {'Win%':>8} {'Avg Surplus':>12}")
+    out.append(_DA[120])
     
-    for pool in sorted(pool_data.values(), key=lambda x: -x['uses']):
-        win_pct = (pool['wins'] / pool['uses'] * 100) if pool['uses'] > 0 else 0
-        avg_surplus = pool['total_surplus'] / pool['uses'] if pool['uses'] > 0 else 0
+    by_uses = sorted(uses.items(), key=lambda x: -x[1])
+    for pool_addr, pool_uses in by_uses:
+        win_pct = wins[pool_addr] / pool_uses * 100
+        avg_surplus = total_surplus[pool_addr] / pool_uses
         
-        print(f"{pool['address']:<44} {pool['kind']:>18} {pool['fee']:>8} "
-              f"{pool['uses']:>6} {pool['wins']:>6} {win_pct:>7.0f}% {avg_surplus:>11.2f}%")
+        out.append(f"{pool_addr:<44} {kinds[pool_addr]:>18} {fees[pool_addr]:>8} "
+                   f"{pool_uses:>6} {wins[pool_addr]:>6} {win_pct:>7.0f}% {avg_surplus:>11.2f}%")
     
     # Show top performing pool details
-    print_section("TOP POOL DETAILS", 120)
+    out.append(render_section("TOP POOL DETAILS", 120))
     
-    top_pool = max(pool_data.values(), key=lambda x: x['uses'])
-    print(f"\nMost Used Pool:")
-    print(f"  Address: {top_pool['address']}")
-    print(f"  Type: {top_pool['kind']}")
-    print(f"  Fee: {top_pool['fee']}")
-    print(f"  Uses: {top_pool['uses']}")
-    win_rate = top_pool['wins']/top_pool['uses']*100
-    print(f"  Wins: {top_pool['wins']} ({win_rate:.0f}%)")
-    print(f"  Auctions: {', '.join(top_pool['auctions'])}")
+    # The sort is stable, so its head is the first-used of the most used pools
+    top_pool = by_uses[0][0]
+    out.append(f"\nMost Used Pool:")
+    out.append(f"  Address: {top_pool}")
+    out.append(f"  Type: {kinds[top_pool]}")
+    out.append(f"  Fee: {fees[top_pool]}")
+    out.append(f"  Uses: {uses[top_pool]}")
+    win_rate = wins[top_pool]/uses[top_pool]*100
+    out.append(f"  Wins: {wins[top_pool]} ({win_rate:.0f}%)")
+    out.append(f"  Auctions: {', '.join(auctions[top_pool])}")
 
 def main():
     """Main viewer function."""
-    auction_dir = Path(os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum"))
-    analysis_files = list(auction_dir.glob("*_analysis.json"))
+    auction_dir = os.environ.get("AUCTION_DIR", "/tmp/auction-data/arbitrum")
+    # Sorted once here; every view takes the files in this order
+    try:
+        analysis_files = sorted(_list_analyses(auction_dir))
+    except FileNotFoundError:
+        analysis_files = []
     
     if not analysis_files:
         print("No analysis files found!")
         print(f"Run 'python3 compare_solutions_detailed.py' first to generate analysis files.")
         return
     
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-        
-        if command == 'summary':
-            view_summary(analysis_files)
-        elif command == 'list':
-            view_detailed_list(analysis_files)
-        elif command == 'pools':
-            view_pools(analysis_files)
-        elif command.startswith('auction'):
-            # View specific auction
-            if len(sys.argv) > 2:
-                auction_id = sys.argv[2]
-                analysis_file = auction_dir / f"{auction_id}_analysis.json"
-                if analysis_file.exists():
-                    view_individual(analysis_file)
+    # Views render into out, which is written in one go; whatever was
+    # rendered still goes out if a view fails part way through
+    out = []
+    try:
+        # Parse command line arguments
+        if len(sys.argv) > 1:
+            command = sys.argv[1].lower()
+            
+            if command == 'summary':
+                view_summary(analysis_files, out)
+            elif command == 'list':
+                view_detailed_list(analysis_files, out)
+            elif command == 'pools':
+                view_pools(analysis_files, out)
+            elif command.startswith('auction'):
+                # View specific auction
+                if len(sys.argv) > 2:
+                    auction_id = sys.argv[2]
+                    analysis_file = os.path.join(auction_dir, f"{auction_id}_analysis.json")
+                    if os.path.exists(analysis_file):
+                        view_individual(analysis_file, out)
+                    else:
+                        out.append(f"Analysis file not found: {analysis_file}")
                 else:
-                    print(f"Analysis file not found: {analysis_file}")
+                    out.append("Please specify auction ID: python3 view_analysis.py auction 11732945")
+            elif command == 'help':
+                render_help(out)
             else:
-                print("Please specify auction ID: python3 view_analysis.py auction 11732945")
-        elif command == 'help':
-            print_help()
+                out.append(f"Unknown command: {command}")
+                render_help(out)
         else:
-            print(f"Unknown command: {command}")
-            print_help()
-    else:
-        # Default: show summary
-        view_summary(analysis_files)
-        print("\n" + "=" * 100)
-        print("💡 TIP: Run with 'list', 'pools', or 'auction <id>' for more details")
-        print("   Example: python3 view_analysis.py auction 11732945")
-        print("   See all options: python3 view_analysis.py help")
+            # Default: show summary
+            view_summary(analysis_files, out)
+            out.append("\n" + _EQ[100])
+            out.append("💡 TIP: Run with 'list', 'pools', or 'auction <id>' for more details")
+            out.append("   Example: python3 view_analysis.py auction 11732945")
+            out.append("   See all options: python3 view_analysis.py help")
+    finally:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
 
-def print_help():
-    """Print help message."""
-    print_header("ANALYSIS VIEWER - HELP")
-    print("""
+def render_help(out):
+    """Render help message into the out list."""
+    out.append(render_header("ANALYSIS VIEWER - HELP"))
+    out.append("""
 Usage: python3 view_analysis.py [command] [options]
 
 Commands: